@@ -86,6 +86,11 @@ class Base(Configuration):
     CALDAV_CALLBACK_BASE_URL = values.Value(
         None, environ_name="CALDAV_CALLBACK_BASE_URL", environ_prefix=None
     )
+    # Maximum number of concurrent requests to the CalDAV server when
+    # find_event_by_uid searches several calendars for an event UID
+    CALDAV_PARALLELISM = values.PositiveIntegerValue(
+        8, environ_name="CALDAV_PARALLELISM", environ_prefix=None
+    )
 
     # Email configuration
     # Default settings - override in environment-specific classes
@@ -122,6 +127,11 @@ class Base(Configuration):
     CALENDAR_ITIP_ENABLED = values.BooleanValue(
         False, environ_name="CALENDAR_ITIP_ENABLED", environ_prefix=None
     )
+    # Send invitation emails from a Celery worker instead of during the CalDAV
+    # scheduling callback. Requires a running worker.
+    CALENDAR_INVITATION_ASYNC = values.BooleanValue(
+        False, environ_name="CALENDAR_INVITATION_ASYNC", environ_prefix=None
+    )
     TRANSLATIONS_JSON_PATH = values.Value(
         "/data/translations.json",
         environ_name="TRANSLATIONS_JSON_PATH",
@@ -263,9 +273,16 @@ class Base(Configuration):
                     "django.template.context_processors.request",
                     "django.template.context_processors.tz",
                 ],
+                # Compiled templates are kept in memory; Django's autoreloader
+                # resets this cache when a template changes in development.
                 "loaders": [
-                    "django.template.loaders.filesystem.Loader",
-                    "django.template.loaders.app_directories.Loader",
+                    (
+                        "django.template.loaders.cached.Loader",
+                        [
+                            "django.template.loaders.filesystem.Loader",
+                            "django.template.loaders.app_directories.Loader",
+                        ],
+                    ),
                 ],
             },
         },
@@ -107,6 +107,7 @@ class CalendarSubscriptionTokenAdmin(admin.ModelAdmin):
         "created_at",
     )
     list_filter = ("is_active",)
+    list_select_related = ("owner",)
     search_fields = ("calendar_name", "owner__email", "caldav_path", "token")
     readonly_fields = ("id", "token", "created_at", "last_accessed_at")
     raw_id_fields = ("owner",)
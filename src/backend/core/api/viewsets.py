@@ -320,9 +320,10 @@ class CalendarViewSet(viewsets.GenericViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        ics_data = uploaded_file.read()
+        # Stream the upload to SabreDAV instead of reading it into memory
+        uploaded_file.seek(0)
         service = ICSImportService()
-        result = service.import_events(request.user, caldav_path, ics_data)
+        result = service.import_events(request.user, caldav_path, uploaded_file)
 
         response_data = {
             "total_events": result.total_events,
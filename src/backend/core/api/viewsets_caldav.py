@@ -15,6 +15,7 @@ import requests
 from core.entitlements import EntitlementsUnavailableError, get_user_entitlements
 from core.services.caldav_service import CalDAVHTTPClient, validate_caldav_proxy_path
 from core.services.calendar_invitation_service import calendar_invitation_service
+from core.tasks import send_invitation_task
 
 logger = logging.getLogger(__name__)
 
@@ -153,7 +154,10 @@ class CalDAVProxyView(View):
                 headers=headers,
                 data=body,
                 auth=auth,
-                timeout=CalDAVHTTPClient.DEFAULT_TIMEOUT,
+                timeout=(
+                    CalDAVHTTPClient.CONNECT_TIMEOUT,
+                    CalDAVHTTPClient.DEFAULT_TIMEOUT,
+                ),
                 allow_redirects=False,
             )
 
@@ -296,6 +300,19 @@ class CalDAVSchedulingCallbackView(View):
 
         # Send the invitation/notification email
         try:
+            if settings.CALENDAR_INVITATION_ASYNC:
+                send_invitation_task.delay(
+                    sender_email=sender,
+                    recipient_email=recipient,
+                    method=method,
+                    icalendar_data=icalendar_data,
+                )
+                return HttpResponse(
+                    status=202,
+                    content="Accepted",
+                    content_type="text/plain",
+                )
+
             success = calendar_invitation_service.send_invitation(
                 sender_email=sender,
                 recipient_email=recipient,
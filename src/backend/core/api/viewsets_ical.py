@@ -1,10 +1,20 @@
 """iCal subscription export views."""
 
+import hashlib
 import logging
+from xml.etree import ElementTree as ET
 
-from django.http import Http404, HttpResponse
+from django.core.cache import cache
+from django.db.models import F
+from django.http import (
+    Http404,
+    HttpResponse,
+    HttpResponseNotModified,
+    StreamingHttpResponse,
+)
 from django.utils import timezone
 from django.utils.decorators import method_decorator
+from django.utils.http import parse_etags
 from django.views import View
 from django.views.decorators.csrf import csrf_exempt
 
@@ -15,6 +25,106 @@ from core.services.caldav_service import CalDAVHTTPClient
 
 logger = logging.getLogger(__name__)
 
+# Depth: 0 PROPFIND asking only for the calendar CTag, which changes whenever
+# any event in the calendar changes.
+CTAG_PROPFIND_BODY = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    '<d:propfind xmlns:d="DAV:" xmlns:cs="http://calendarserver.org/ns/">'
+    "<d:prop><cs:getctag/></d:prop>"
+    "</d:propfind>"
+)
+CTAG_ELEMENT = "{http://calendarserver.org/ns/}getctag"
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Exports are cached per calendar CTag, so a cached body is never stale: any
+# change to the calendar changes the key. The timeout only bounds memory use.
+# Looking the CTag up costs one Depth: 0 PROPFIND per GET, which is cheap for
+# SabreDAV compared to generating the export, but is an extra round trip on
+# every cache miss.
+EXPORT_CACHE_TIMEOUT = 300
+# Larger exports are streamed without being cached, so that neither the cache
+# nor the worker holds a whole large calendar in memory.
+EXPORT_CACHE_MAX_SIZE = 1024 * 1024
+
+
+def _extract_ctag(propfind_body):
+    """Return the CTag found in a PROPFIND multistatus body, or None."""
+    try:
+        multistatus = ET.fromstring(propfind_body)
+    except ET.ParseError:
+        logger.warning("Could not parse the CTag PROPFIND response")
+        return None
+    element = multistatus.find(f".//{CTAG_ELEMENT}")
+    if element is None or not element.text:
+        return None
+    return element.text.strip().strip('"') or None
+
+
+def _accepts_gzip(accept_encoding):
+    """Return whether an Accept-Encoding header value allows gzip.
+
+    Codings are weighed by their q-value, so "gzip;q=0" is a refusal. When
+    gzip is not listed, the "*" wildcard decides.
+    """
+    weights = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding] = weight
+    return weights.get("gzip", weights.get("*", 0.0)) > 0
+
+
+def _export_etag(ctag, gzipped):
+    """Return the ETag of an export for a CTag, or None without CTag.
+
+    The gzipped variant gets a weak ETag so that it is not taken for the
+    identity bytes; If-None-Match uses the weak comparison and matches both.
+    """
+    if not ctag:
+        return None
+    return f'W/"{ctag}"' if gzipped else f'"{ctag}"'
+
+
+def _export_cache_key(caldav_path, ctag, accepts_gzip):
+    """Build the cache key of a calendar export for a given CTag."""
+    digest = hashlib.sha256(f"{caldav_path}\n{ctag}".encode()).hexdigest()
+    return f"ical:export:{'gzip' if accepts_gzip else 'identity'}:{digest}"
+
+
+def _iter_raw_content(response, cache_key=None):
+    """Yield the undecoded upstream body, releasing the connection at the end.
+
+    When a cache key is given, the gzipped body is cached once fully sent,
+    unless it grows beyond EXPORT_CACHE_MAX_SIZE: buffering stops as soon as
+    the limit is crossed.
+    """
+    chunks = [] if cache_key else None
+    size = 0
+    try:
+        for chunk in response.raw.stream(STREAM_CHUNK_SIZE, decode_content=False):
+            if chunks is not None:
+                size += len(chunk)
+                if size <= EXPORT_CACHE_MAX_SIZE:
+                    chunks.append(chunk)
+                else:
+                    chunks = None
+            yield chunk
+        if chunks is not None:
+            cache.set(cache_key, ("gzip", b"".join(chunks)), EXPORT_CACHE_TIMEOUT)
+    finally:
+        response.close()
+
 
 @method_decorator(csrf_exempt, name="dispatch")
 class ICalExportView(View):
@@ -30,12 +140,16 @@ class ICalExportView(View):
     RFC 5545 compliant iCal data.
     """
 
-    def get(self, request, token):
-        """Handle GET requests for iCal export."""
-        # Lookup token
+    @staticmethod
+    def _get_subscription(token):
+        """Return the active subscription for a token, or raise Http404.
+
+        Only the columns needed to proxy the export are fetched, as a dict,
+        to avoid hydrating the owner User instance.
+        """
         subscription = (
             CalendarSubscriptionToken.objects.filter(token=token, is_active=True)
-            .select_related("owner")
+            .values("caldav_path", "calendar_name", owner_email=F("owner__email"))
             .first()
         )
 
@@ -43,60 +157,192 @@ class ICalExportView(View):
             logger.warning("Invalid or inactive subscription token: %s", token)
             raise Http404("Calendar not found")
 
-        # Update last_accessed_at atomically to avoid race conditions
-        # when multiple calendar clients poll simultaneously
-        CalendarSubscriptionToken.objects.filter(token=token, is_active=True).update(
-            last_accessed_at=timezone.now()
+        return subscription
+
+    @staticmethod
+    def _set_export_headers(response, subscription, etag):
+        """Set the headers shared by GET, HEAD and 304 export responses."""
+        if etag:
+            response["ETag"] = etag
+        # The body and its ETag depend on whether the client accepts gzip
+        response["Vary"] = "Accept-Encoding"
+        # Set filename for download (use calendar_name or fallback to "calendar")
+        display_name = subscription["calendar_name"] or "calendar"
+        safe_name = display_name.replace('"', '\\"')
+        response["Content-Disposition"] = f'attachment; filename="{safe_name}.ics"'
+        # Prevent caching of potentially sensitive data
+        response["Cache-Control"] = "no-store, private"
+        # Prevent token leakage via referrer
+        response["Referrer-Policy"] = "no-referrer"
+        return response
+
+    @staticmethod
+    def _is_not_modified(request, ctag):
+        """Return whether the client's If-None-Match matches the CTag.
+
+        If-None-Match uses the weak comparison, so W/ prefixes are ignored.
+        """
+        etags = {
+            etag.removeprefix("W/")
+            for etag in parse_etags(request.META.get("HTTP_IF_NONE_MATCH", ""))
+        }
+        return bool(ctag) and ("*" in etags or f'"{ctag}"' in etags)
+
+    @staticmethod
+    def _propfind_ctag(http, subscription):
+        """Ask SabreDAV for the calendar CTag with a Depth: 0 PROPFIND."""
+        return http.request(
+            "PROPFIND",
+            subscription["owner_email"],
+            subscription["caldav_path"].lstrip("/"),
+            data=CTAG_PROPFIND_BODY,
+            content_type="application/xml; charset=utf-8",
+            extra_headers={"Depth": "0"},
         )
 
-        # Proxy to SabreDAV
+    def head(self, request, token):
+        """Handle HEAD requests without generating the full export.
+
+        Calendar clients poll with HEAD to detect changes. Instead of proxying
+        the whole export, fetch the calendar CTag with a Depth: 0 PROPFIND and
+        expose it as the ETag, answering 304 when it matches If-None-Match.
+        """
+        subscription = self._get_subscription(token)
+
         http = CalDAVHTTPClient()
         try:
-            caldav_path = subscription.caldav_path.lstrip("/")
-            response = http.request(
-                "GET",
-                subscription.owner.email,
-                caldav_path,
-                query="export",
-            )
+            response = self._propfind_ctag(http, subscription)
         except ValueError:
             logger.error("CALDAV_OUTBOUND_API_KEY is not configured")
-            return HttpResponse(status=500, content="iCal export not configured")
+            return HttpResponse(status=500)
         except requests.exceptions.RequestException as e:
-            logger.error("CalDAV server error during iCal export: %s", str(e))
-            return HttpResponse(
-                status=502,
-                content="Calendar server unavailable",
-                content_type="text/plain",
-            )
+            logger.error("CalDAV server error during iCal HEAD: %s", str(e))
+            return HttpResponse(status=502)
 
-        if response.status_code != 200:
+        if response.status_code != 207:
             logger.error(
-                "CalDAV server returned %d for iCal export: %s",
-                response.status_code,
-                response.content[:500],
+                "CalDAV server returned %d for iCal HEAD", response.status_code
             )
-            return HttpResponse(
-                status=502,
-                content="Error generating calendar data",
-                content_type="text/plain",
+            return HttpResponse(status=502)
+
+        ctag = _extract_ctag(response.content)
+        etag = _export_etag(
+            ctag, _accepts_gzip(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        )
+        if self._is_not_modified(request, ctag):
+            return self._set_export_headers(
+                HttpResponseNotModified(), subscription, etag
             )
 
-        # Return ICS response
-        django_response = HttpResponse(
-            content=response.content,
-            status=200,
-            content_type="text/calendar; charset=utf-8",
+        return self._set_export_headers(
+            HttpResponse(status=200, content_type="text/calendar; charset=utf-8"),
+            subscription,
+            etag,
         )
-        # Set filename for download (use calendar_name or fallback to "calendar")
-        display_name = subscription.calendar_name or "calendar"
-        safe_name = display_name.replace('"', '\\"')
-        django_response["Content-Disposition"] = (
-            f'attachment; filename="{safe_name}.ics"'
+
+    def get(self, request, token):
+        """Handle GET requests for iCal export."""
+        subscription = self._get_subscription(token)
+
+        # Update last_accessed_at atomically to avoid race conditions
+        # when multiple calendar clients poll simultaneously
+        CalendarSubscriptionToken.objects.filter(token=token, is_active=True).update(
+            last_accessed_at=timezone.now()
         )
-        # Prevent caching of potentially sensitive data
-        django_response["Cache-Control"] = "no-store, private"
-        # Prevent token leakage via referrer
-        django_response["Referrer-Policy"] = "no-referrer"
 
-        return django_response
+        # When the client accepts gzip, ask SabreDAV for a gzipped export and
+        # forward the compressed bytes as-is instead of decoding them here.
+        accepts_gzip = _accepts_gzip(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+
+        http = CalDAVHTTPClient()
+        caldav_path = subscription["caldav_path"].lstrip("/")
+
+        # Most polls hit an unchanged calendar: answer 304 to clients that
+        # already have it, or look the export up by CTag before asking
+        # SabreDAV to generate it again.
+        ctag = None
+        try:
+            ctag_response = self._propfind_ctag(http, subscription)
+        except (ValueError, requests.exceptions.RequestException) as e:
+            logger.warning("Could not fetch CTag for iCal export: %s", str(e))
+        else:
+            if ctag_response.status_code == 207:
+                ctag = _extract_ctag(ctag_response.content)
+
+        if self._is_not_modified(request, ctag):
+            return self._set_export_headers(
+                HttpResponseNotModified(),
+                subscription,
+                _export_etag(ctag, accepts_gzip),
+            )
+
+        cache_key = _export_cache_key(caldav_path, ctag, accepts_gzip) if ctag else None
+        cached = cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            content_encoding, content = cached
+        else:
+            # Proxy to SabreDAV
+            try:
+                response = http.request(
+                    "GET",
+                    subscription["owner_email"],
+                    caldav_path,
+                    query="export",
+                    extra_headers=(
+                        {"Accept-Encoding": "gzip"} if accepts_gzip else None
+                    ),
+                    stream=accepts_gzip,
+                )
+            except ValueError:
+                logger.error("CALDAV_OUTBOUND_API_KEY is not configured")
+                return HttpResponse(status=500, content="iCal export not configured")
+            except requests.exceptions.RequestException as e:
+                logger.error("CalDAV server error during iCal export: %s", str(e))
+                return HttpResponse(
+                    status=502,
+                    content="Calendar server unavailable",
+                    content_type="text/plain",
+                )
+
+            if response.status_code != 200:
+                logger.error(
+                    "CalDAV server returned %d for iCal export: %s",
+                    response.status_code,
+                    response.content[:500],
+                )
+                return HttpResponse(
+                    status=502,
+                    content="Error generating calendar data",
+                    content_type="text/plain",
+                )
+
+            if accepts_gzip and response.headers.get("Content-Encoding") == "gzip":
+                content_encoding = "gzip"
+                content = _iter_raw_content(response, cache_key)
+            else:
+                content_encoding = None
+                content = response.content
+                if cache_key and len(content) <= EXPORT_CACHE_MAX_SIZE:
+                    cache.set(cache_key, (None, content), EXPORT_CACHE_TIMEOUT)
+
+        # Return ICS response
+        if isinstance(content, bytes):
+            django_response = HttpResponse(
+                content=content,
+                status=200,
+                content_type="text/calendar; charset=utf-8",
+            )
+        else:
+            django_response = StreamingHttpResponse(
+                content,
+                status=200,
+                content_type="text/calendar; charset=utf-8",
+            )
+        if content_encoding:
+            django_response["Content-Encoding"] = content_encoding
+
+        return self._set_export_headers(
+            django_response,
+            subscription,
+            _export_etag(ctag, content_encoding == "gzip"),
+        )
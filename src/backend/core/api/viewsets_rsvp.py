@@ -1,7 +1,7 @@
 """RSVP view for handling invitation responses from email links."""
 
+import functools
 import logging
-import re
 from datetime import timezone as dt_timezone
 
 from django.core.signing import BadSignature, Signer
@@ -11,7 +11,11 @@ from django.utils.decorators import method_decorator
 from django.views import View
 from django.views.decorators.csrf import csrf_exempt
 
-from core.services.caldav_service import CalDAVHTTPClient
+from core.services.caldav_service import PARTSTAT_UNCHANGED, CalDAVHTTPClient
+from core.services.calendar_invitation_service import (
+    ICalendarParser,
+    strip_mailto,
+)
 from core.services.translation_service import TranslationService
 
 logger = logging.getLogger(__name__)
@@ -34,17 +38,51 @@ PARTSTAT_VALUES = {
     "declined": "DECLINED",
 }
 
+# action -> (PARTSTAT, icon, color), so the view resolves an action in one lookup
+_ACTION_TABLE = {
+    action: (PARTSTAT_VALUES[action], PARTSTAT_ICONS[action], PARTSTAT_COLORS[action])
+    for action in PARTSTAT_VALUES
+}
+
+RSVP_KEYS = (
+    "rsvp.accepted",
+    "rsvp.tentative",
+    "rsvp.declined",
+    "rsvp.responseSent",
+    "rsvp.error.title",
+    "rsvp.error.invalidLink",
+    "rsvp.error.invalidAction",
+    "rsvp.error.invalidToken",
+    "rsvp.error.invalidPayload",
+    "rsvp.error.eventNotFound",
+    "rsvp.error.eventPast",
+    "rsvp.error.notAttendee",
+    "rsvp.error.updateFailed",
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_rsvp_strings(lang):
+    """Return the RSVP page strings for a language.
+
+    The returned dict is shared between requests and must not be mutated.
+    """
+    return {key: TranslationService.t(key, lang) for key in RSVP_KEYS}
+
+
+TranslationService.on_reset(_get_rsvp_strings.cache_clear)
+
 
 def _render_error(request, message, lang="fr"):
     """Render the RSVP error page."""
-    t = TranslationService.t
+    strings = _get_rsvp_strings(lang)
     return render(
         request,
         "rsvp/response.html",
         {
-            "page_title": t("rsvp.error.title", lang),
+            "page_title": strings["rsvp.error.title"],
             "error": message,
-            "error_title": t("rsvp.error.invalidLink", lang),
+            "error_title": strings["rsvp.error.invalidLink"],
             "header_color": "#dc2626",
             "lang": lang,
         },
@@ -52,18 +90,14 @@ def _render_error(request, message, lang="fr"):
     )
 
 
-def _is_event_past(icalendar_data):
+def _is_event_past(vevent):
     """Check if the event has already ended.
 
+    Takes the VEVENT block extracted by ICalendarParser.extract_vevent_block.
     For recurring events without DTEND, falls back to DTSTART.
     If the event has an RRULE, it is never considered past (the
     recurrence may extend indefinitely).
     """
-    from core.services.calendar_invitation_service import (  # noqa: PLC0415  # pylint: disable=import-outside-toplevel
-        ICalendarParser,
-    )
-
-    vevent = ICalendarParser.extract_vevent_block(icalendar_data)
     if not vevent:
         return False
 
@@ -94,11 +128,13 @@ class RSVPView(View):
         token = request.GET.get("token", "")
         action = request.GET.get("action", "")
         lang = TranslationService.resolve_language(request=request)
-        t = TranslationService.t
+        strings = _get_rsvp_strings(lang)
 
         # Validate action
-        if action not in PARTSTAT_VALUES:
-            return _render_error(request, t("rsvp.error.invalidAction", lang), lang)
+        entry = _ACTION_TABLE.get(action)
+        if entry is None:
+            return _render_error(request, strings["rsvp.error.invalidAction"], lang)
+        partstat, status_icon, header_color = entry
 
         # Unsign token — tokens don't have a built-in expiry,
         # but RSVPs are rejected once the event has ended (_is_event_past).
@@ -106,49 +142,49 @@ class RSVPView(View):
         try:
             payload = signer.unsign_object(token)
         except BadSignature:
-            return _render_error(request, t("rsvp.error.invalidToken", lang), lang)
+            return _render_error(request, strings["rsvp.error.invalidToken"], lang)
 
         uid = payload.get("uid")
         recipient_email = payload.get("email")
         # Strip mailto: prefix (case-insensitive) in case it leaked into the token
-        organizer_email = re.sub(
-            r"^mailto:", "", payload.get("organizer", ""), flags=re.IGNORECASE
-        )
+        organizer_email = strip_mailto(payload.get("organizer", ""))
 
         if not uid or not recipient_email or not organizer_email:
-            return _render_error(request, t("rsvp.error.invalidPayload", lang), lang)
+            return _render_error(request, strings["rsvp.error.invalidPayload"], lang)
 
         http = CalDAVHTTPClient()
 
         # Find the event in the organizer's CalDAV calendars
         calendar_data, href = http.find_event_by_uid(organizer_email, uid)
         if not calendar_data or not href:
-            return _render_error(request, t("rsvp.error.eventNotFound", lang), lang)
+            return _render_error(request, strings["rsvp.error.eventNotFound"], lang)
+
+        # Extract the VEVENT block once, reused for the past check and summary
+        vevent = ICalendarParser.extract_vevent_block(calendar_data)
 
         # Check if the event is already over
-        if _is_event_past(calendar_data):
-            return _render_error(request, t("rsvp.error.eventPast", lang), lang)
+        if _is_event_past(vevent):
+            return _render_error(request, strings["rsvp.error.eventPast"], lang)
 
         # Update the attendee's PARTSTAT
-        partstat = PARTSTAT_VALUES[action]
         updated_data = CalDAVHTTPClient.update_attendee_partstat(
             calendar_data, recipient_email, partstat
         )
         if not updated_data:
-            return _render_error(request, t("rsvp.error.notAttendee", lang), lang)
+            return _render_error(request, strings["rsvp.error.notAttendee"], lang)
 
-        # PUT the updated event back to CalDAV
-        success = http.put_event(organizer_email, href, updated_data)
-        if not success:
-            return _render_error(request, t("rsvp.error.updateFailed", lang), lang)
+        # PUT the updated event back to CalDAV, unless the attendee already
+        # answered the same way (e.g. clicked the same link twice)
+        if updated_data is not PARTSTAT_UNCHANGED:
+            success = http.put_event(organizer_email, href, updated_data)
+            if not success:
+                return _render_error(
+                    request, strings["rsvp.error.updateFailed"], lang
+                )
 
         # Extract event summary for display
-        from core.services.calendar_invitation_service import (  # noqa: PLC0415  # pylint: disable=import-outside-toplevel
-            ICalendarParser,
-        )
-
-        summary = ICalendarParser.extract_property(calendar_data, "SUMMARY") or ""
-        label = t(f"rsvp.{action}", lang)
+        summary = ICalendarParser.extract_property(vevent or "", "SUMMARY") or ""
+        label = strings[f"rsvp.{action}"]
 
         return render(
             request,
@@ -156,9 +192,9 @@ class RSVPView(View):
             {
                 "page_title": label,
                 "heading": label,
-                "message": t("rsvp.responseSent", lang),
-                "status_icon": PARTSTAT_ICONS[action],
-                "header_color": PARTSTAT_COLORS[action],
+                "message": strings["rsvp.responseSent"],
+                "status_icon": status_icon,
+                "header_color": header_color,
                 "event_summary": summary,
                 "lang": lang,
             },
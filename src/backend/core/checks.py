@@ -0,0 +1,23 @@
+"""System checks for the calendars core application."""
+
+from django.conf import settings
+from django.core import checks
+
+
+@checks.register()
+def check_caldav_outbound_api_key(app_configs, **kwargs):
+    """Report a missing CalDAV outbound API key at startup.
+
+    Without it, every request to the CalDAV server fails; catching it here
+    avoids discovering it on the first user request.
+    """
+    # pylint: disable=unused-argument
+    if settings.CALDAV_OUTBOUND_API_KEY:
+        return []
+    return [
+        checks.Warning(
+            "CALDAV_OUTBOUND_API_KEY is not configured.",
+            hint="Requests from Django to the CalDAV server will be rejected.",
+            id="core.W001",
+        )
+    ]
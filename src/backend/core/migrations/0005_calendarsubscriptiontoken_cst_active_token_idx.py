@@ -0,0 +1,27 @@
+# Generated by Django 5.2.9 on 2026-10-16 10:47
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_remove_calendarshare_calendar_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='calendarsubscriptiontoken',
+            name='token_active_idx',
+        ),
+        migrations.AlterField(
+            model_name='calendarsubscriptiontoken',
+            name='token',
+            field=models.UUIDField(default=uuid.uuid4, help_text='Secret token used in the subscription URL', unique=True),
+        ),
+        migrations.AddIndex(
+            model_name='calendarsubscriptiontoken',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['token'], include=('owner', 'caldav_path', 'calendar_name'), name='cst_active_token_idx'),
+        ),
+    ]
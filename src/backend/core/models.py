@@ -35,6 +35,7 @@ class RoleChoices(models.TextChoices):
 
 
 PRIVILEGED_ROLES = [RoleChoices.ADMIN, RoleChoices.OWNER]
+_PRIVILEGED_ROLES_SET = frozenset(PRIVILEGED_ROLES)
 
 
 class LinkReachChoices(models.TextChoices):
@@ -264,13 +265,16 @@ class BaseAccess(BaseModel):
                 except (self._meta.model.DoesNotExist, IndexError):
                     roles = []
 
-        is_owner_or_admin = bool(
-            set(roles).intersection({RoleChoices.OWNER, RoleChoices.ADMIN})
-        )
+        # Materialize once: roles may be a lazy values_list queryset
+        roles = frozenset(roles)
+        is_owner_or_admin = bool(roles & _PRIVILEGED_ROLES_SET)
         if self.role == RoleChoices.OWNER:
+            # Another owner must remain: stop at the first one instead of counting
             can_delete = (
                 RoleChoices.OWNER in roles
-                and resource.accesses.filter(role=RoleChoices.OWNER).count() > 1
+                and resource.accesses.filter(role=RoleChoices.OWNER)
+                .exclude(pk=self.pk)
+                .exists()
             )
             set_role_to = (
                 [RoleChoices.ADMIN, RoleChoices.EDITOR, RoleChoices.READER]
@@ -337,7 +341,6 @@ class CalendarSubscriptionToken(models.Model):
 
     token = models.UUIDField(
         unique=True,
-        db_index=True,
         default=uuid.uuid4,
         help_text=_("Secret token used in the subscription URL"),
     )
@@ -362,9 +365,16 @@ class CalendarSubscriptionToken(models.Model):
             )
         ]
         indexes = [
-            # Composite index for the public iCal endpoint query:
+            # Partial covering index for the public iCal endpoint query:
             # CalendarSubscriptionToken.objects.filter(token=..., is_active=True)
-            models.Index(fields=["token", "is_active"], name="token_active_idx"),
+            # Only active tokens are indexed, and the included columns let
+            # PostgreSQL answer it with an index-only scan.
+            models.Index(
+                fields=["token"],
+                include=["owner", "caldav_path", "calendar_name"],
+                condition=models.Q(is_active=True),
+                name="cst_active_token_idx",
+            ),
         ]
 
     def __str__(self):
@@ -2,26 +2,92 @@
 
 import logging
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta
+from http.cookiejar import DefaultCookiePolicy
 from typing import Optional
 from urllib.parse import unquote
 from uuid import uuid4
 
 from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 
 import icalendar
 import requests
+import sentry_sdk
 
 import caldav as caldav_lib
 from caldav import DAVClient
+from caldav.collection import CalendarSet
 from caldav.elements.cdav import CalendarDescription
 from caldav.elements.dav import DisplayName
 from caldav.elements.ical import CalendarColor
-from caldav.lib.error import NotFoundError
+from caldav.lib.error import AuthorizationError, NotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Returned by update_attendee_partstat when the attendee already has the
+# requested PARTSTAT, so callers can skip the serialization and the PUT.
+PARTSTAT_UNCHANGED = object()
+
+
+@contextmanager
+def _timed(operation: str):
+    """Time a CalDAV round trip.
+
+    The duration is recorded as a Sentry span (when tracing is enabled) and
+    logged at debug level with the outcome, so slow operations show up
+    without extra instrumentation at each call site.
+    """
+    started = time.perf_counter()
+    result = "ok"
+    with sentry_sdk.start_span(op="caldav", name=operation):
+        try:
+            yield
+        except Exception:
+            result = "error"
+            raise
+        finally:
+            logger.debug(
+                "CalDAV %s %s in %.1f ms",
+                operation,
+                result,
+                (time.perf_counter() - started) * 1000,
+            )
+
+
+def _fmt_dt(value: datetime) -> str:
+    """Format a datetime as an iCalendar UTC date-time (YYYYMMDDTHHMMSSZ).
+
+    Equivalent to strftime("%Y%m%dT%H%M%SZ") without the locale-aware
+    formatting overhead.
+    """
+    return (
+        f"{value.year:04d}{value.month:02d}{value.day:02d}"
+        f"T{value.hour:02d}{value.minute:02d}{value.second:02d}Z"
+    )
+
+
+def _fmt_d(value: date) -> str:
+    """Format a date as an iCalendar date (YYYYMMDD)."""
+    return f"{value.year:04d}{value.month:02d}{value.day:02d}"
+
+
+def _fmt_date_prop(prop):
+    """Format a DTSTART/DTEND property value as a string, None if absent."""
+    if not prop:
+        return None
+    value = prop.dt
+    # datetime is a subclass of date, so it must be checked first
+    if isinstance(value, datetime):
+        return _fmt_dt(value)
+    if isinstance(value, date):
+        return _fmt_d(value)
+    return value
+
 
 class CalDAVHTTPClient:
     """Low-level HTTP client for CalDAV server communication.
@@ -32,9 +98,19 @@ class CalDAVHTTPClient:
 
     BASE_URI_PATH = "/api/v1.0/caldav"
     DEFAULT_TIMEOUT = 30
+    # Fail fast when the CalDAV server cannot be reached (e.g. stale pooled
+    # connection) instead of waiting for the full read timeout.
+    CONNECT_TIMEOUT = 5
+
+    # HTTP session shared by all DAVClient instances (see get_dav_client)
+    _dav_session = None
+    # HTTP session shared by all request() calls
+    _http_session = None
 
     def __init__(self):
         self.base_url = settings.CALDAV_URL.rstrip("/")
+        # Root URL of the CalDAV API, used by DAVClient instances
+        self.dav_url = f"{self.base_url}{self.BASE_URI_PATH}/"
 
     @staticmethod
     def get_api_key() -> str:
@@ -78,6 +154,7 @@ class CalDAVHTTPClient:
         extra_headers: dict | None = None,
         timeout: int | None = None,
         content_type: str | None = None,
+        stream: bool = False,
     ) -> requests.Response:
         """Make an authenticated HTTP request to the CalDAV server."""
         headers = self.build_base_headers(email)
@@ -87,40 +164,96 @@ class CalDAVHTTPClient:
             headers.update(extra_headers)
 
         url = self.build_url(path, query)
-        return requests.request(
-            method=method,
-            url=url,
-            headers=headers,
-            data=data,
-            timeout=timeout or self.DEFAULT_TIMEOUT,
-        )
+        with _timed(method):
+            return self._get_http_session().request(
+                method=method,
+                url=url,
+                headers=headers,
+                data=data,
+                timeout=(self.CONNECT_TIMEOUT, timeout or self.DEFAULT_TIMEOUT),
+                stream=stream,
+            )
+
+    @classmethod
+    def _get_http_session(cls) -> requests.Session:
+        """Return the pooled HTTP session used by request().
+
+        Keeps connections to the CalDAV server alive between requests.
+        Requests are made on behalf of different users, so cookies are
+        never stored.
+        """
+        if cls._http_session is None:
+            session = requests.Session()
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            cls._http_session = session
+        return cls._http_session
 
     def get_dav_client(self, email: str) -> DAVClient:
         """Return a configured caldav.DAVClient for the given user email."""
         headers = self.build_base_headers(email)
-        caldav_url = f"{self.base_url}{self.BASE_URI_PATH}/"
-        return DAVClient(
-            url=caldav_url,
+        client = DAVClient(
+            url=self.dav_url,
             username=None,
             password=None,
-            timeout=self.DEFAULT_TIMEOUT,
+            timeout=(self.CONNECT_TIMEOUT, self.DEFAULT_TIMEOUT),
             headers=headers,
         )
+        # DAVClient opens its own HTTP session. Headers are sent per request,
+        # so share a single session across clients to keep connections alive.
+        # Clients act for different users, so that session never stores
+        # cookies.
+        if CalDAVHTTPClient._dav_session is None:
+            client.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            CalDAVHTTPClient._dav_session = client.session
+        else:
+            client.session.close()
+            client.session = CalDAVHTTPClient._dav_session
+        return client
+
+    @staticmethod
+    def _find_event_in_calendar(cal, uid: str) -> tuple[str, str] | None:
+        """Look up an event by UID in one calendar. Returns (ical_data, href)."""
+        try:
+            event = cal.object_by_uid(uid)
+        except caldav_lib.error.NotFoundError:
+            return None
+        return event.data, str(event.url.path)
 
     def find_event_by_uid(self, email: str, uid: str) -> tuple[str | None, str | None]:
         """Find an event by UID across all of the user's calendars.
 
+        Calendars are queried concurrently (bounded by CALDAV_PARALLELISM)
+        and the first match wins: pending lookups are cancelled and running
+        ones are not waited for. A calendar that fails to answer is logged
+        and skipped.
+
         Returns (ical_data, href) or (None, None).
         """
         client = self.get_dav_client(email)
         try:
-            principal = client.principal()
-            for cal in principal.calendars():
+            calendars = client.principal().calendars()
+            if calendars:
+                max_workers = min(len(calendars), settings.CALDAV_PARALLELISM)
+                executor = ThreadPoolExecutor(max_workers=max_workers)
                 try:
-                    event = cal.object_by_uid(uid)
-                    return event.data, str(event.url.path)
-                except caldav_lib.error.NotFoundError:
-                    continue
+                    futures = {
+                        executor.submit(self._find_event_in_calendar, cal, uid): cal
+                        for cal in calendars
+                    }
+                    for future in as_completed(futures):
+                        try:
+                            found = future.result()
+                        except Exception:  # pylint: disable=broad-exception-caught
+                            logger.exception(
+                                "CalDAV error looking up event %s in %s",
+                                uid,
+                                futures[future].url,
+                            )
+                            continue
+                        if found:
+                            return found
+                finally:
+                    executor.shutdown(wait=False, cancel_futures=True)
             logger.warning("Event UID %s not found in user %s calendars", uid, email)
             return None, None
         except Exception:  # pylint: disable=broad-exception-caught
@@ -150,26 +283,32 @@ class CalDAVHTTPClient:
             return False
 
     @staticmethod
-    def update_attendee_partstat(
-        ical_data: str, email: str, new_partstat: str
-    ) -> str | None:
+    def update_attendee_partstat(ical_data: str, email: str, new_partstat: str):
         """Update the PARTSTAT of an attendee in iCalendar data.
 
-        Returns the modified iCalendar string, or None if attendee not found.
+        Returns the modified iCalendar string, None if attendee not found,
+        or PARTSTAT_UNCHANGED if the attendee already has ``new_partstat``.
         """
         cal = icalendar.Calendar.from_ical(ical_data)
-        updated = False
+        found = False
+        changed = False
 
         for component in cal.walk("VEVENT"):
             for _name, attendee in component.property_items("ATTENDEE"):
                 attendee_val = str(attendee).lower()
                 if email.lower() in attendee_val:
-                    attendee.params["PARTSTAT"] = icalendar.vText(new_partstat)
-                    updated = True
+                    found = True
+                    previous = str(attendee.params.get("PARTSTAT", "")).upper()
+                    if previous != new_partstat:
+                        attendee.params["PARTSTAT"] = icalendar.vText(new_partstat)
+                        changed = True
 
-        if not updated:
+        if not found:
             return None
 
+        if not changed:
+            return PARTSTAT_UNCHANGED
+
         return cal.to_ical().decode("utf-8")
 
 
@@ -178,9 +317,16 @@ class CalDAVClient:
     Client for communicating with CalDAV server using the caldav library.
     """
 
+    # The calendar home of a principal never moves, cache its discovery for a day
+    CALENDAR_HOME_CACHE_TIMEOUT = 60 * 60 * 24
+
     def __init__(self):
         self._http = CalDAVHTTPClient()
         self.base_url = self._http.base_url
+        # caldav DAVClient objects, keyed by user email
+        self._clients = {}
+        # caldav Calendar objects, keyed by (user email, calendar path)
+        self._calendars = {}
 
     def _get_client(self, user) -> DAVClient:
         """
@@ -188,23 +334,61 @@ class CalDAVClient:
 
         The CalDAV server requires API key authentication via Authorization header
         and X-Forwarded-User header for user identification.
+
+        The client is built once per user and reused by subsequent operations
+        on this instance; all clients share one pooled HTTP session.
+        """
+        client = self._clients.get(user.email)
+        if client is None:
+            client = self._http.get_dav_client(user.email)
+            self._clients[user.email] = client
+        return client
+
+    def _get_calendar(self, user, calendar_path: str):
         """
-        return self._http.get_dav_client(user.email)
+        Get the caldav Calendar object for a calendar path.
+
+        The object is memoized on this client so that repeated operations on
+        the same calendar reuse it instead of rebuilding the URL and wrapper.
+        """
+        key = (user.email, calendar_path)
+        calendar = self._calendars.get(key)
+        if calendar is None:
+            client = self._get_client(user)
+            calendar = client.calendar(url=f"{self.base_url}{calendar_path}")
+            self._calendars[key] = calendar
+        return calendar
+
+    def _get_calendar_home(self, client: DAVClient, user) -> CalendarSet:
+        """
+        Get the calendar home set of the given user.
+
+        Discovering it costs two PROPFINDs (current-user-principal, then
+        calendar-home-set), so the resulting URL is cached per user.
+        """
+        cache_key = self._calendar_home_cache_key(user)
+        home_url = cache.get(cache_key)
+        if home_url is None:
+            home_url = str(client.principal().calendar_home_set.url)
+            cache.set(cache_key, home_url, self.CALENDAR_HOME_CACHE_TIMEOUT)
+        return CalendarSet(client=client, url=home_url)
+
+    @staticmethod
+    def _calendar_home_cache_key(user) -> str:
+        return f"caldav:calendar_home:{user.email}"
 
     def get_calendar_info(self, user, calendar_path: str) -> dict | None:
         """
         Get calendar information from CalDAV server.
         Returns dict with name, color, description or None if not found.
         """
-        client = self._get_client(user)
-        calendar_url = f"{self.base_url}{calendar_path}"
-
         try:
-            calendar = client.calendar(url=calendar_url)
+            calendar = self._get_calendar(user, calendar_path)
             # Fetch properties
-            props = calendar.get_properties(
-                [DisplayName(), CalendarColor(), CalendarDescription()]
-            )
+            with _timed("get_calendar_info"):
+                props = calendar.get_properties(
+                    [DisplayName(), CalendarColor(), CalendarDescription()]
+                )
 
             name = props.get(DisplayName.tag, "Calendar")
             color = props.get(CalendarColor.tag, settings.DEFAULT_CALENDAR_COLOR)
@@ -235,11 +419,20 @@ class CalDAVClient:
         Returns the CalDAV server path for the calendar.
         """
         client = self._get_client(user)
-        principal = client.principal()
 
         try:
-            # Create calendar using caldav library
-            calendar = principal.make_calendar(name=calendar_name)
+            # Create calendar using caldav library. The calendar home URL is
+            # cached, so this is a single MKCALENDAR at a known URL.
+            calendar_home = self._get_calendar_home(client, user)
+            try:
+                with _timed("create_calendar"):
+                    calendar = calendar_home.make_calendar(
+                        name=calendar_name, cal_id=calendar_id
+                    )
+            except (AuthorizationError, NotFoundError):
+                # The cached calendar home may be stale: rediscover it next time
+                cache.delete(self._calendar_home_cache_key(user))
+                raise
 
             # Set calendar color if provided
             if color:
@@ -270,10 +463,19 @@ class CalDAVClient:
         calendar_path: str,
         start: Optional[datetime] = None,
         end: Optional[datetime] = None,
+        expand: bool = True,
+        limit: Optional[int] = None,
     ) -> list:
         """
         Get events from a calendar within a time range.
         Returns list of event dictionaries with parsed data.
+
+        The time range is filtered server-side by the calendar-query REPORT.
+        Pass expand=False to get recurring series as their master event
+        instead of one entry per occurrence.
+
+        `limit` only caps how many events are parsed: the REPORT has no
+        result limit, so the server still sends every matching event.
         """
 
         # Default to current month if no range specified
@@ -282,11 +484,7 @@ class CalDAVClient:
         if end is None:
             end = start + timedelta(days=31)
 
-        client = self._get_client(user)
-
-        # Get calendar by URL
-        calendar_url = f"{self.base_url}{calendar_path}"
-        calendar = client.calendar(url=calendar_url)
+        calendar = self._get_calendar(user, calendar_path)
 
         try:
             # Search for events in the date range
@@ -294,21 +492,22 @@ class CalDAVClient:
             start_date = start.date() if isinstance(start, datetime) else start
             end_date = end.date() if isinstance(end, datetime) else end
 
-            events = calendar.search(
-                event=True,
-                start=start_date,
-                end=end_date,
-                expand=True,  # Expand recurring events
-            )
-
-            # Parse events into dictionaries
-            parsed_events = []
-            for event in events:
-                event_data = self._parse_event(event)
-                if event_data:
-                    parsed_events.append(event_data)
-
-            return parsed_events
+            with _timed("get_events"):
+                events = calendar.search(
+                    event=True,
+                    start=start_date,
+                    end=end_date,
+                    expand=expand,
+                )
+            if limit is not None:
+                events = events[:limit]
+
+            # Parse events into dictionaries, dropping the unparsable ones
+            return [
+                event_data
+                for event_data in map(self._parse_event, events)
+                if event_data is not None
+            ]
         except NotFoundError:
             logger.warning("Calendar not found at path: %s", calendar_path)
             return []
@@ -322,12 +521,11 @@ class CalDAVClient:
         The ics_data should be a complete VCALENDAR string.
         Returns the event UID.
         """
-        client = self._get_client(user)
-        calendar_url = f"{self.base_url}{calendar_path}"
-        calendar = client.calendar(url=calendar_url)
+        calendar = self._get_calendar(user, calendar_path)
 
         try:
-            event = calendar.save_event(ics_data)
+            with _timed("create_event"):
+                event = calendar.save_event(ics_data)
             event_uid = str(event.icalendar_component.get("uid", ""))
             logger.info("Created event in CalDAV server: %s", event_uid)
             return event_uid
@@ -341,9 +539,7 @@ class CalDAVClient:
         Returns the event UID.
         """
 
-        client = self._get_client(user)
-        calendar_url = f"{self.base_url}{calendar_path}"
-        calendar = client.calendar(url=calendar_url)
+        calendar = self._get_calendar(user, calendar_path)
 
         # Extract event data
         dtstart = event_data.get("start", timezone.now())
@@ -357,21 +553,18 @@ class CalDAVClient:
 
         try:
             # Create event using caldav library
-            event = calendar.save_event(
-                dtstart=dtstart,
-                dtend=dtend,
-                uid=event_uid,
-                summary=summary,
-                description=description,
-                location=location,
-            )
-
-            # Extract UID from created event
-            # The caldav library returns an Event object
-            if hasattr(event, "icalendar_component"):
-                event_uid = str(event.icalendar_component.get("uid", event_uid))
-            elif hasattr(event, "vobject_instance"):
-                event_uid = event.vobject_instance.vevent.uid.value
+            with _timed("create_event"):
+                event = calendar.save_event(
+                    dtstart=dtstart,
+                    dtend=dtend,
+                    uid=event_uid,
+                    summary=summary,
+                    description=description,
+                    location=location,
+                )
+
+            # Extract UID from the created caldav Event object
+            event_uid = str(event.icalendar_component.get("uid", event_uid))
 
             logger.info("Created event in CalDAV server: %s", event_uid)
             return event_uid
@@ -384,28 +577,15 @@ class CalDAVClient:
     ) -> None:
         """Update an existing event in CalDAV server."""
 
-        client = self._get_client(user)
-        calendar_url = f"{self.base_url}{calendar_path}"
-        calendar = client.calendar(url=calendar_url)
+        calendar = self._get_calendar(user, calendar_path)
 
         try:
-            # Search for the event by UID
-            events = calendar.search(event=True)
-            target_event = None
-
-            for event in events:
-                event_uid_value = None
-                if hasattr(event, "icalendar_component"):
-                    event_uid_value = str(event.icalendar_component.get("uid", ""))
-                elif hasattr(event, "vobject_instance"):
-                    event_uid_value = event.vobject_instance.vevent.uid.value
-
-                if event_uid_value == event_uid:
-                    target_event = event
-                    break
-
-            if not target_event:
-                raise ValueError(f"Event with UID {event_uid} not found")
+            # Fetch the event by UID with a server-side filtered REPORT
+            try:
+                with _timed("event_by_uid"):
+                    target_event = calendar.event_by_uid(event_uid)
+            except NotFoundError as e:
+                raise ValueError(f"Event with UID {event_uid} not found") from e
 
             # Update event properties
             dtstart = event_data.get("start")
@@ -416,20 +596,29 @@ class CalDAVClient:
 
             # Update using icalendar component
             component = target_event.icalendar_component
-
-            if dtstart:
-                component["dtstart"] = dtstart
-            if dtend:
-                component["dtend"] = dtend
-            if summary:
-                component["summary"] = summary
-            if description is not None:
-                component["description"] = description
-            if location is not None:
-                component["location"] = location
+            updates = {}
+
+            for name, value in (("dtstart", dtstart), ("dtend", dtend)):
+                current = component.get(name)
+                if value and (current is None or current.dt != value):
+                    updates[name] = value
+            if summary and str(component.get("summary", "")) != summary:
+                updates["summary"] = summary
+            for name, value in (("description", description), ("location", location)):
+                if value is not None and str(component.get(name, "")) != value:
+                    updates[name] = value
+
+            # Nothing to write back: skip the PUT
+            if not updates:
+                logger.info("Event already up to date in CalDAV server: %s", event_uid)
+                return
+
+            for name, value in updates.items():
+                component[name] = value
 
             # Save the updated event
-            target_event.save()
+            with _timed("update_event"):
+                target_event.save()
 
             logger.info("Updated event in CalDAV server: %s", event_uid)
         except Exception as e:
@@ -439,31 +628,19 @@ class CalDAVClient:
     def delete_event(self, user, calendar_path: str, event_uid: str) -> None:
         """Delete an event from CalDAV server."""
 
-        client = self._get_client(user)
-        calendar_url = f"{self.base_url}{calendar_path}"
-        calendar = client.calendar(url=calendar_url)
+        calendar = self._get_calendar(user, calendar_path)
 
         try:
-            # Search for the event by UID
-            events = calendar.search(event=True)
-            target_event = None
-
-            for event in events:
-                event_uid_value = None
-                if hasattr(event, "icalendar_component"):
-                    event_uid_value = str(event.icalendar_component.get("uid", ""))
-                elif hasattr(event, "vobject_instance"):
-                    event_uid_value = event.vobject_instance.vevent.uid.value
-
-                if event_uid_value == event_uid:
-                    target_event = event
-                    break
-
-            if not target_event:
-                raise ValueError(f"Event with UID {event_uid} not found")
+            # Fetch the event by UID with a server-side filtered REPORT
+            try:
+                with _timed("event_by_uid"):
+                    target_event = calendar.event_by_uid(event_uid)
+            except NotFoundError as e:
+                raise ValueError(f"Event with UID {event_uid} not found") from e
 
             # Delete the event
-            target_event.delete()
+            with _timed("delete_event"):
+                target_event.delete()
 
             logger.info("Deleted event from CalDAV server: %s", event_uid)
         except Exception as e:
@@ -477,31 +654,18 @@ class CalDAVClient:
         try:
             component = event.icalendar_component
 
-            event_data = {
-                "uid": str(component.get("uid", "")),
+            uid = str(component.get("uid", ""))
+            if not uid:
+                return None
+
+            return {
+                "uid": uid,
                 "title": str(component.get("summary", "")),
-                "start": component.get("dtstart").dt
-                if component.get("dtstart")
-                else None,
-                "end": component.get("dtend").dt if component.get("dtend") else None,
+                "start": _fmt_date_prop(component.get("dtstart")),
+                "end": _fmt_date_prop(component.get("dtend")),
                 "description": str(component.get("description", "")),
                 "location": str(component.get("location", "")),
             }
-
-            # Convert datetime to string format for consistency
-            if event_data["start"]:
-                if isinstance(event_data["start"], datetime):
-                    event_data["start"] = event_data["start"].strftime("%Y%m%dT%H%M%SZ")
-                elif isinstance(event_data["start"], date):
-                    event_data["start"] = event_data["start"].strftime("%Y%m%d")
-
-            if event_data["end"]:
-                if isinstance(event_data["end"], datetime):
-                    event_data["end"] = event_data["end"].strftime("%Y%m%dT%H%M%SZ")
-                elif isinstance(event_data["end"], date):
-                    event_data["end"] = event_data["end"].strftime("%Y%m%d")
-
-            return event_data if event_data.get("uid") else None
         except Exception as e:  # noqa: BLE001  # pylint: disable=broad-exception-caught
             logger.warning("Failed to parse event: %s", str(e))
             return None
@@ -8,8 +8,10 @@ The service is called by the CalDAVSchedulingCallbackView when the CalDAV
 server (sabre/dav) needs to send invitations to external attendees.
 """
 
+import functools
 import logging
 import re
+import string
 from dataclasses import dataclass
 from datetime import datetime
 from datetime import timezone as dt_timezone
@@ -17,16 +19,142 @@ from email import encoders
 from email.mime.base import MIMEBase
 from typing import Optional
 from urllib.parse import urlencode
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from django.conf import settings
 from django.core.mail import EmailMultiAlternatives
 from django.core.signing import Signer
+from django.template import TemplateDoesNotExist, TemplateSyntaxError
 from django.template.loader import render_to_string
 
 from core.services.translation_service import TranslationService
 
 logger = logging.getLogger(__name__)
 
+PARAM_RE = re.compile(r";([^=]+)=([^;]+)")
+# Upper-cases ASCII letters only, so indexes stay aligned with the original
+# string (str.upper() can change the length of non-ASCII text).
+ASCII_UPPER = str.maketrans(string.ascii_lowercase, string.ascii_uppercase)
+
+
+def _unfold(icalendar: str) -> str:
+    """Unfold iCalendar content lines (RFC 5545, section 3.1).
+
+    A line break followed by a space or tab continues the previous line.
+    Most payloads are not folded, so they are returned as-is.
+    """
+    if "\n " not in icalendar and "\n\t" not in icalendar:
+        return icalendar
+    return (
+        icalendar.replace("\r\n ", "")
+        .replace("\r\n\t", "")
+        .replace("\n ", "")
+        .replace("\n\t", "")
+    )
+
+
+def strip_mailto(address: str) -> str:
+    """Remove a leading (case-insensitive) mailto: from a calendar address."""
+    address = address.strip()
+    if address[:7].lower() == "mailto:":
+        return address[7:].strip()
+    return address
+
+
+def _method_lines(icalendar: str, upper: str):
+    """Yield (start, value_end, line_end) for each METHOD content line.
+
+    ``upper`` is ``icalendar`` translated with ASCII_UPPER, so that property
+    names match in any case. ``value_end`` is where the value stops and
+    ``line_end`` is past its line terminator, or None when the line is not
+    terminated.
+    """
+    start = upper.find("METHOD:")
+    while start >= 0:
+        value_start = start + len("METHOD:")
+        value_end = len(icalendar)
+        for terminator in ("\r", "\n"):
+            pos = icalendar.find(terminator, value_start, value_end)
+            if pos >= 0:
+                value_end = pos
+        if value_end > value_start:
+            if icalendar.startswith("\r\n", value_end):
+                yield start, value_end, value_end + 2
+            elif icalendar.startswith("\n", value_end):
+                yield start, value_end, value_end + 1
+            else:
+                yield start, value_end, None
+        start = upper.find("METHOD:", max(value_end, start + 1))
+
+
+@functools.lru_cache(maxsize=64)
+def _get_zone(tzid: str) -> Optional[ZoneInfo]:
+    """Return the ZoneInfo for a TZID, or None if the timezone is unknown."""
+    try:
+        return ZoneInfo(tzid)
+    except (ZoneInfoNotFoundError, ValueError):
+        logger.debug("Unknown timezone %s, keeping naive datetime", tzid)
+        return None
+
+
+@functools.lru_cache(maxsize=64)
+def _property_re(property_name: str, flags: int = 0) -> re.Pattern:
+    """Return the compiled pattern matching a property line."""
+    return re.compile(rf"^{property_name}(;[^:]*)?:(.+)$", re.MULTILINE | flags)
+
+
+@functools.lru_cache(maxsize=64)
+def _property_with_params_re(property_name: str, flags: int = 0) -> re.Pattern:
+    """Return the compiled pattern matching a property line and its params."""
+    return re.compile(rf"^{property_name}((?:;[^:]+)*):(.+)$", re.MULTILINE | flags)
+
+
+def _search_property(pattern_factory, property_name: str, icalendar: str):
+    """Search for a property line, trying the usual upper-case spelling first.
+
+    Case-sensitive patterns keep re's literal prefix scan; the
+    case-insensitive one only runs when that misses.
+    """
+    match = pattern_factory(property_name.upper()).search(icalendar)
+    if match is None:
+        match = pattern_factory(property_name, re.IGNORECASE).search(icalendar)
+    return match
+
+
+@functools.lru_cache(maxsize=64)
+def _static_strings(lang: str, type_key: str) -> dict:
+    """Return the email strings that depend only on the language and type.
+
+    The returned dicts are shared between emails and must not be mutated.
+    """
+    t = TranslationService.t
+    return {
+        "content": {
+            "title": t(f"email.{type_key}.title", lang),
+            "heading": t(f"email.{type_key}.heading", lang),
+            "badge": t(f"email.{type_key}.badge", lang),
+        },
+        "labels": {
+            "when": t("email.labels.when", lang),
+            "until": t("email.labels.until", lang),
+            "location": t("email.labels.location", lang),
+            "videoConference": t("email.labels.videoConference", lang),
+            "organizer": t("email.labels.organizer", lang),
+            "attendee": t("email.labels.attendee", lang),
+            "description": t("email.labels.description", lang),
+            "wasScheduledFor": t("email.labels.wasScheduledFor", lang),
+        },
+        "actions": {
+            "accept": t("email.actions.accept", lang),
+            "maybe": t("email.actions.maybe", lang),
+            "decline": t("email.actions.decline", lang),
+        },
+        "instructions": t(f"email.instructions.{type_key}", lang),
+    }
+
+
+TranslationService.on_reset(_static_strings.cache_clear)
+
 
 @dataclass
 class EventDetails:  # pylint: disable=too-many-instance-attributes
@@ -67,23 +195,25 @@ class ICalendarParser:
         only the VEVENT properties.
         """
         # Handle multi-line values first
-        icalendar = re.sub(r"\r?\n[ \t]", "", icalendar)
+        icalendar = _unfold(icalendar)
 
         # Find VEVENT block
-        pattern = r"BEGIN:VEVENT\s*\n(.+?)\nEND:VEVENT"
-        match = re.search(pattern, icalendar, re.DOTALL | re.IGNORECASE)
-        if match:
-            return match.group(0)
-        return None
+        upper = icalendar.translate(ASCII_UPPER)
+        start = upper.find("BEGIN:VEVENT")
+        if start < 0:
+            return None
+        end = upper.find("\nEND:VEVENT", start)
+        if end < 0:
+            return None
+        return icalendar[start : end + len("\nEND:VEVENT")]
 
     @staticmethod
     def extract_property(icalendar: str, property_name: str) -> Optional[str]:
         """Extract a simple property value from iCalendar data."""
         # Handle multi-line values (lines starting with space/tab are continuations)
-        icalendar = re.sub(r"\r?\n[ \t]", "", icalendar)
+        icalendar = _unfold(icalendar)
 
-        pattern = rf"^{property_name}(;[^:]*)?:(.+)$"
-        match = re.search(pattern, icalendar, re.MULTILINE | re.IGNORECASE)
+        match = _search_property(_property_re, property_name, icalendar)
         if match:
             return match.group(2).strip()
         return None
@@ -98,10 +228,9 @@ class ICalendarParser:
         Returns (value, {param_name: param_value, ...})
         """
         # Handle multi-line values
-        icalendar = re.sub(r"\r?\n[ \t]", "", icalendar)
+        icalendar = _unfold(icalendar)
 
-        pattern = rf"^{property_name}((?:;[^:]+)*):(.+)$"
-        match = re.search(pattern, icalendar, re.MULTILINE | re.IGNORECASE)
+        match = _search_property(_property_with_params_re, property_name, icalendar)
         if not match:
             return None, {}
 
@@ -112,13 +241,41 @@ class ICalendarParser:
         params = {}
         if params_str:
             # Split by ; but not within quotes
-            param_matches = re.findall(r";([^=]+)=([^;]+)", params_str)
+            param_matches = PARAM_RE.findall(params_str)
             for param_name, raw_value in param_matches:
                 # Remove quotes if present
                 params[param_name.upper()] = raw_value.strip('"')
 
         return value, params
 
+    @staticmethod
+    def _tokenize(vevent: str) -> dict[str, list[tuple[str, dict]]]:
+        """
+        Split an unfolded VEVENT block into its properties in a single pass.
+
+        Returns {NAME: [(value, {PARAM_NAME: param_value, ...}), ...]}, with
+        the occurrences of each property in document order.
+        """
+        properties = {}
+        for line in vevent.split("\n"):
+            colon = line.find(":")
+            if colon <= 0 or colon == len(line) - 1:
+                continue
+            head = line[:colon]
+            semicolon = head.find(";")
+            if semicolon < 0:
+                name, params = head, {}
+            else:
+                name = head[:semicolon]
+                params = {
+                    param_name.upper(): raw_value.strip('"')
+                    for param_name, raw_value in PARAM_RE.findall(head[semicolon:])
+                }
+            properties.setdefault(name.upper(), []).append(
+                (line[colon + 1 :].strip(), params)
+            )
+        return properties
+
     @staticmethod
     def parse_datetime(
         value: Optional[str], tzid: Optional[str] = None
@@ -129,36 +286,36 @@ class ICalendarParser:
 
         value = value.strip()
 
-        # Try different formats
-        formats = [
-            "%Y%m%dT%H%M%SZ",  # UTC format
-            "%Y%m%dT%H%M%S",  # Local format
-            "%Y%m%d",  # Date only (all-day event)
-        ]
-
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(value, fmt)
-                if fmt == "%Y%m%dT%H%M%SZ":
+        # iCalendar values have a fixed layout, slice them instead of strptime:
+        # YYYYMMDD (all-day), YYYYMMDDTHHMMSS (local) or YYYYMMDDTHHMMSSZ (UTC)
+        length = len(value)
+        try:
+            if length == 8 and value.isdigit():
+                return datetime(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+            if (
+                length in (15, 16)
+                and value[8] in "Tt"
+                and value[:8].isdigit()
+                and value[9:15].isdigit()
+            ):
+                dt = datetime(
+                    int(value[0:4]),
+                    int(value[4:6]),
+                    int(value[6:8]),
+                    int(value[9:11]),
+                    int(value[11:13]),
+                    int(value[13:15]),
+                )
+                if length == 15:
+                    # Local time - if the timezone is unknown, keep it naive
+                    tz = _get_zone(tzid) if tzid else None
+                    return dt.replace(tzinfo=tz) if tz is not None else dt
+                if value[15] in "Zz":
                     # Already UTC
-                    dt = dt.replace(tzinfo=dt_timezone.utc)
-                elif tzid:
-                    # Has timezone info - try to convert using zoneinfo
-                    try:
-                        from zoneinfo import (  # noqa: PLC0415  # pylint: disable=import-outside-toplevel
-                            ZoneInfo,
-                        )
-
-                        tz = ZoneInfo(tzid)
-                        dt = dt.replace(tzinfo=tz)
-                    except (KeyError, ValueError):
-                        # If timezone conversion fails, keep as naive datetime
-                        logger.debug(
-                            "Unknown timezone %s, keeping naive datetime", tzid
-                        )
-                return dt
-            except ValueError:
-                continue
+                    return dt.replace(tzinfo=dt_timezone.utc)
+        except ValueError:
+            # Out of range values, e.g. month 13
+            pass
 
         logger.warning("Could not parse datetime: %s (tzid: %s)", value, tzid)
         return None
@@ -185,20 +342,24 @@ class ICalendarParser:
                 logger.error("No VEVENT block found in iCalendar data")
                 return None
 
+            # Tokenize the VEVENT block once; the first occurrence of each
+            # property wins
+            properties = cls._tokenize(vevent_block)
+
+            def first(name):
+                occurrences = properties.get(name)
+                return occurrences[0] if occurrences else (None, {})
+
             # Extract basic properties from VEVENT block
-            uid = cls.extract_property(vevent_block, "UID")
-            summary = cls.extract_property(vevent_block, "SUMMARY") or ""
-            description = cls.extract_property(vevent_block, "DESCRIPTION")
-            location = cls.extract_property(vevent_block, "LOCATION")
-            url = cls.extract_property(vevent_block, "URL")
+            uid = first("UID")[0]
+            summary = first("SUMMARY")[0] or ""
+            description = first("DESCRIPTION")[0]
+            location = first("LOCATION")[0]
+            url = first("URL")[0]
 
             # Parse dates with timezone support - from VEVENT block only
-            dtstart_raw, dtstart_params = cls.extract_property_with_params(
-                vevent_block, "DTSTART"
-            )
-            dtend_raw, dtend_params = cls.extract_property_with_params(
-                vevent_block, "DTEND"
-            )
+            dtstart_raw, dtstart_params = first("DTSTART")
+            dtend_raw, dtend_params = first("DTEND")
             dtstart_tzid = dtstart_params.get("TZID")
             dtend_tzid = dtend_params.get("TZID")
             dtstart = cls.parse_datetime(dtstart_raw, dtstart_tzid)
@@ -210,32 +371,26 @@ class ICalendarParser:
             )
 
             # Extract organizer from VEVENT block
-            organizer_value, organizer_params = cls.extract_property_with_params(
-                vevent_block, "ORGANIZER"
-            )
+            organizer_value, organizer_params = first("ORGANIZER")
             organizer_email = ""
             if organizer_value:
-                organizer_email = organizer_value.replace("mailto:", "").strip()
+                organizer_email = strip_mailto(organizer_value)
             organizer_name = organizer_params.get("CN")
 
             # Extract attendee info for the recipient from VEVENT block
             # Find the ATTENDEE line that matches the recipient
-            recipient_clean = recipient_email.replace("mailto:", "").lower()
+            recipient_clean = strip_mailto(recipient_email).lower()
             attendee_name = None
 
-            # Look for ATTENDEE lines in VEVENT block
-            attendee_pattern = rf"^ATTENDEE[^:]*:mailto:{re.escape(recipient_clean)}$"
-            attendee_match = re.search(
-                attendee_pattern, vevent_block, re.MULTILINE | re.IGNORECASE
-            )
-            if attendee_match:
-                full_line = attendee_match.group(0)
-                cn_match = re.search(r"CN=([^;:]+)", full_line, re.IGNORECASE)
-                if cn_match:
-                    attendee_name = cn_match.group(1).strip('"')
+            # Look for the ATTENDEE line of the recipient in VEVENT block
+            recipient_mailto = f"mailto:{recipient_clean}"
+            for attendee_value, attendee_params in properties.get("ATTENDEE", ()):
+                if attendee_value.lower() == recipient_mailto:
+                    attendee_name = attendee_params.get("CN")
+                    break
 
             # Get sequence number from VEVENT block
-            sequence_str = cls.extract_property(vevent_block, "SEQUENCE")
+            sequence_str = first("SEQUENCE")[0]
             sequence = (
                 int(sequence_str) if sequence_str and sequence_str.isdigit() else 0
             )
@@ -263,7 +418,7 @@ class ICalendarParser:
                 raw_icalendar=icalendar,
             )
 
-        except Exception as e:  # pylint: disable=broad-exception-caught
+        except (TypeError, ValueError) as e:
             logger.exception("Failed to parse iCalendar data: %s", e)
             return None
 
@@ -289,9 +444,6 @@ class CalendarInvitationService:  # pylint: disable=too-many-instance-attributes
     METHOD_CANCEL = "CANCEL"  # Cancellation
     METHOD_REPLY = "REPLY"  # Attendee response
 
-    def __init__(self):
-        self.parser = ICalendarParser()
-
     def send_invitation(
         self,
         sender_email: str,
@@ -312,11 +464,11 @@ class CalendarInvitationService:  # pylint: disable=too-many-instance-attributes
             True if email was sent successfully, False otherwise
         """
         # Clean email addresses (remove mailto: prefix)
-        sender = sender_email.replace("mailto:", "").strip()
-        recipient = recipient_email.replace("mailto:", "").strip()
+        sender = strip_mailto(sender_email)
+        recipient = strip_mailto(recipient_email)
 
         # Parse event details
-        event = self.parser.parse(icalendar_data, recipient)
+        event = ICalendarParser.parse(icalendar_data, recipient)
         if not event:
             logger.error(
                 "Failed to parse iCalendar data for invitation to %s", recipient
@@ -330,18 +482,13 @@ class CalendarInvitationService:  # pylint: disable=too-many-instance-attributes
             summary = event.summary or t("email.noTitle", lang)
 
             # Determine email type and get appropriate subject/content
-            if method == self.METHOD_CANCEL:
-                subject = t("email.subject.cancel", lang, summary=summary)
-                template_prefix = "calendar_invitation_cancel"
-            elif method == self.METHOD_REPLY:
-                subject = t("email.subject.reply", lang, summary=summary)
-                template_prefix = "calendar_invitation_reply"
-            elif event.sequence > 0:
-                subject = t("email.subject.update", lang, summary=summary)
-                template_prefix = "calendar_invitation_update"
-            else:
-                subject = t("email.subject.invitation", lang, summary=summary)
-                template_prefix = "calendar_invitation"
+            type_key = self._email_type(method, event)
+            subject = t(f"email.subject.{type_key}", lang, summary=summary)
+            template_prefix = (
+                "calendar_invitation"
+                if type_key == "invitation"
+                else f"calendar_invitation_{type_key}"
+            )
 
             # Build context for templates
             context = self._build_template_context(event, method, lang)
@@ -365,12 +512,23 @@ class CalendarInvitationService:  # pylint: disable=too-many-instance-attributes
                 event_uid=event.uid,
             )
 
-        except Exception as e:  # pylint: disable=broad-exception-caught
+        except (TemplateDoesNotExist, TemplateSyntaxError) as e:
             logger.exception(
                 "Failed to send calendar invitation to %s: %s", recipient, e
             )
             return False
 
+    @classmethod
+    def _email_type(cls, method: str, event: EventDetails) -> str:
+        """Return the email type key: cancel, reply, update or invitation."""
+        if method == cls.METHOD_CANCEL:
+            return "cancel"
+        if method == cls.METHOD_REPLY:
+            return "reply"
+        if event.sequence > 0:
+            return "update"
+        return "invitation"
+
     def _build_template_context(  # pylint: disable=too-many-locals
         self, event: EventDetails, method: str, lang: str = "fr"
     ) -> dict:
@@ -379,38 +537,26 @@ class CalendarInvitationService:  # pylint: disable=too-many-instance-attributes
         summary = event.summary or t("email.noTitle", lang)
 
         # Format dates for display
+        start_str = TranslationService.format_date(event.dtstart, lang)
+        end_str = (
+            TranslationService.format_date(event.dtend, lang)
+            if event.dtend
+            else start_str
+        )
         if event.is_all_day:
-            start_str = TranslationService.format_date(event.dtstart, lang)
-            end_str = (
-                TranslationService.format_date(event.dtend, lang)
-                if event.dtend
-                else start_str
-            )
             time_str = t("email.allDay", lang)
         else:
-            time_format = "%H:%M"
-            start_str = TranslationService.format_date(event.dtstart, lang)
-            start_time = event.dtstart.strftime(time_format)
-            end_time = event.dtend.strftime(time_format) if event.dtend else ""
-            end_str = (
-                TranslationService.format_date(event.dtend, lang)
-                if event.dtend
-                else start_str
-            )
-            time_str = f"{start_time} - {end_time}" if end_time else start_time
+            dtstart, dtend = event.dtstart, event.dtend
+            time_str = f"{dtstart.hour:02d}:{dtstart.minute:02d}"
+            if dtend:
+                time_str += f" - {dtend.hour:02d}:{dtend.minute:02d}"
 
         organizer_display = event.organizer_name or event.organizer_email
         attendee_display = event.attendee_name or event.attendee_email
 
         # Determine email type key for content lookups
-        if method == self.METHOD_CANCEL:
-            type_key = "cancel"
-        elif method == self.METHOD_REPLY:
-            type_key = "reply"
-        elif event.sequence > 0:
-            type_key = "update"
-        else:
-            type_key = "invitation"
+        type_key = self._email_type(method, event)
+        strings = _static_strings(lang, type_key)
 
         context = {
             "event": event,
@@ -428,32 +574,17 @@ class CalendarInvitationService:  # pylint: disable=too-many-instance-attributes
             "app_url": getattr(settings, "APP_URL", ""),
             # Translated content blocks
             "content": {
-                "title": t(f"email.{type_key}.title", lang),
-                "heading": t(f"email.{type_key}.heading", lang),
+                **strings["content"],
                 "body": t(
                     f"email.{type_key}.body",
                     lang,
                     organizer=organizer_display,
                     attendee=attendee_display,
                 ),
-                "badge": t(f"email.{type_key}.badge", lang),
-            },
-            "labels": {
-                "when": t("email.labels.when", lang),
-                "until": t("email.labels.until", lang),
-                "location": t("email.labels.location", lang),
-                "videoConference": t("email.labels.videoConference", lang),
-                "organizer": t("email.labels.organizer", lang),
-                "attendee": t("email.labels.attendee", lang),
-                "description": t("email.labels.description", lang),
-                "wasScheduledFor": t("email.labels.wasScheduledFor", lang),
             },
-            "actions": {
-                "accept": t("email.actions.accept", lang),
-                "maybe": t("email.actions.maybe", lang),
-                "decline": t("email.actions.decline", lang),
-            },
-            "instructions": t(f"email.instructions.{type_key}", lang),
+            "labels": strings["labels"],
+            "actions": strings["actions"],
+            "instructions": strings["instructions"],
             "footer": t(
                 f"email.footer.{'invitation' if type_key == 'invitation' else 'notification'}",
                 lang,
@@ -465,9 +596,7 @@ class CalendarInvitationService:  # pylint: disable=too-many-instance-attributes
         if method == self.METHOD_REQUEST:
             signer = Signer(salt="rsvp")
             # Strip mailto: prefix (case-insensitive) for shorter tokens
-            organizer = re.sub(
-                r"^mailto:", "", event.organizer_email, flags=re.IGNORECASE
-            )
+            organizer = strip_mailto(event.organizer_email)
             token = signer.sign_object(
                 {
                     "uid": event.uid,
@@ -499,30 +628,44 @@ class CalendarInvitationService:  # pylint: disable=too-many-instance-attributes
         calendar object — our own RSVP web links handle responses instead.
         """
         itip_enabled = getattr(settings, "CALENDAR_ITIP_ENABLED", False)
+        upper = icalendar_data.translate(ASCII_UPPER)
 
         if itip_enabled:
-            if "METHOD:" not in icalendar_data.upper():
-                icalendar_data = re.sub(
-                    r"(VERSION:2\.0\r?\n)",
-                    rf"\1METHOD:{method}\r\n",
-                    icalendar_data,
-                    flags=re.IGNORECASE,
-                )
+            if "METHOD:" not in upper:
+                version = upper.find("VERSION:2.0")
+                end = version + len("VERSION:2.0")
+                newline = "\r\n" if icalendar_data.startswith("\r\n", end) else "\n"
+                if version >= 0 and icalendar_data.startswith(newline, end):
+                    end += len(newline)
+                    icalendar_data = (
+                        f"{icalendar_data[:end]}METHOD:{method}\r\n"
+                        f"{icalendar_data[end:]}"
+                    )
             else:
-                icalendar_data = re.sub(
-                    r"METHOD:[^\r\n]+",
-                    f"METHOD:{method}",
-                    icalendar_data,
-                    flags=re.IGNORECASE,
-                )
+                method_line = f"METHOD:{method}"
+                parts = []
+                last = 0
+                for start, value_end, _ in _method_lines(icalendar_data, upper):
+                    if icalendar_data[start:value_end] == method_line:
+                        # Already set, leave the line where it is
+                        continue
+                    parts.append(icalendar_data[last:start])
+                    parts.append(method_line)
+                    last = value_end
+                if last:
+                    parts.append(icalendar_data[last:])
+                    icalendar_data = "".join(parts)
         else:
             # Strip any existing METHOD so clients treat it as a plain event
-            icalendar_data = re.sub(
-                r"METHOD:[^\r\n]+\r?\n",
-                "",
-                icalendar_data,
-                flags=re.IGNORECASE,
-            )
+            parts = []
+            last = 0
+            for start, _, line_end in _method_lines(icalendar_data, upper):
+                if line_end is not None:
+                    parts.append(icalendar_data[last:start])
+                    last = line_end
+            if last:
+                parts.append(icalendar_data[last:])
+                icalendar_data = "".join(parts)
 
         return icalendar_data
 
@@ -567,15 +710,14 @@ class CalendarInvitationService:  # pylint: disable=too-many-instance-attributes
             # Add HTML alternative
             email.attach_alternative(html_body, "text/html")
 
-            # Add ICS attachment with proper MIME type
-            ics_attachment = MIMEBase("text", "calendar")
+            # Add ICS attachment with proper MIME type. iCalendar is line-folded
+            # text, so it goes out as 7bit/8bit rather than base64.
+            content_type_params = {"charset": "utf-8"}
+            if getattr(settings, "CALENDAR_ITIP_ENABLED", False):
+                content_type_params["method"] = ics_method
+            ics_attachment = MIMEBase("text", "calendar", **content_type_params)
             ics_attachment.set_payload(ics_content.encode("utf-8"))
-            encoders.encode_base64(ics_attachment)
-            itip_enabled = getattr(settings, "CALENDAR_ITIP_ENABLED", False)
-            content_type = "text/calendar; charset=utf-8"
-            if itip_enabled:
-                content_type += f"; method={ics_method}"
-            ics_attachment.add_header("Content-Type", content_type)
+            encoders.encode_7or8bit(ics_attachment)
             ics_attachment.add_header(
                 "Content-Disposition", 'attachment; filename="invite.ics"'
             )
@@ -595,7 +737,9 @@ class CalendarInvitationService:  # pylint: disable=too-many-instance-attributes
             )
             return True
 
-        except Exception as e:  # pylint: disable=broad-exception-caught
+        except (OSError, ValueError) as e:
+            # SMTPException and socket errors are OSErrors; BadHeaderError is
+            # a ValueError
             logger.exception(
                 "Failed to send calendar invitation email to %s: %s", to_email, e
             )
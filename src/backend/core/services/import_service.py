@@ -38,7 +38,7 @@ class ICSImportService:
     def __init__(self):
         self._http = CalDAVHTTPClient()
 
-    def import_events(self, user, caldav_path: str, ics_data: bytes) -> ImportResult:
+    def import_events(self, user, caldav_path: str, ics_data) -> ImportResult:
         """Import events from ICS data into a calendar.
 
         Sends the raw ICS bytes to SabreDAV's ?import endpoint which
@@ -49,7 +49,8 @@ class ICSImportService:
             user: The authenticated user performing the import.
             caldav_path: CalDAV path of the calendar
                 (e.g. /calendars/user@example.com/uuid/).
-            ics_data: Raw ICS file content.
+            ics_data: Raw ICS file content, as bytes or as an uploaded file.
+                Files are streamed to SabreDAV without being read into memory.
         """
         result = ImportResult()
 
@@ -61,7 +62,8 @@ class ICSImportService:
 
         # Timeout scales with file size: 60s base + 30s per MB of ICS data.
         # 8000 events (~4MB) took ~70s in practice.
-        timeout = 60 + int(len(ics_data) / 1024 / 1024) * 30
+        size = ics_data.size if hasattr(ics_data, "size") else len(ics_data)
+        timeout = 60 + int(size / 1024 / 1024) * 30
 
         try:
             response = self._http.request(
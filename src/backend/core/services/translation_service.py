@@ -2,6 +2,7 @@
 
 import json
 import logging
+import re
 from datetime import datetime
 from typing import Optional
 
@@ -9,7 +10,10 @@ from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
-WEEKDAY_KEYS = [
+# {{var}} placeholders in translation strings
+PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+WEEKDAY_KEYS = (
     "monday",
     "tuesday",
     "wednesday",
@@ -17,9 +21,9 @@ WEEKDAY_KEYS = [
     "friday",
     "saturday",
     "sunday",
-]
+)
 
-MONTH_KEYS = [
+MONTH_KEYS = (
     "",
     "january",
     "february",
@@ -33,14 +37,26 @@ MONTH_KEYS = [
     "october",
     "november",
     "december",
-]
+)
 
 
 class TranslationService:
     """Lightweight translation service backed by translations.json."""
 
+    # {lang: {"dotted.key": value}}, flattened once at load time. Values with
+    # placeholders are stored pre-split, see _compile().
     _translations = None
 
+    # Callables run by reset(), so that caches derived from the translations
+    # elsewhere are dropped with them. See on_reset().
+    _reset_callbacks = []
+
+    @classmethod
+    def on_reset(cls, callback):
+        """Register a callable to run whenever the translations are reset."""
+        cls._reset_callbacks.append(callback)
+        return callback
+
     @classmethod
     def _load(cls):
         """Load translations from JSON file (cached at class level)."""
@@ -52,18 +68,48 @@ class TranslationService:
             raise RuntimeError("TRANSLATIONS_JSON_PATH setting is not configured")
 
         with open(path, encoding="utf-8") as f:
-            cls._translations = json.load(f)
+            data = json.load(f)
+
+        cls._translations = {
+            lang: cls._flatten(lang_data.get("translation", lang_data))
+            for lang, lang_data in data.items()
+        }
 
     @classmethod
-    def _get_nested(cls, data: dict, dotted_key: str):
-        """Traverse a nested dict using dot-separated key."""
-        parts = dotted_key.split(".")
-        current = data
-        for part in parts:
-            if not isinstance(current, dict) or part not in current:
-                return None
-            current = current[part]
-        return current if isinstance(current, str) else None
+    def _flatten(cls, data: dict, prefix: str = "") -> dict:
+        """Flatten nested translations into {"dotted.key": value}.
+
+        Only string leaves are kept, compiled with _compile().
+        """
+        flat = {}
+        for key, value in data.items():
+            dotted_key = f"{prefix}{key}"
+            if isinstance(value, dict):
+                flat.update(cls._flatten(value, f"{dotted_key}."))
+            elif isinstance(value, str):
+                flat[dotted_key] = cls._compile(value)
+        return flat
+
+    @staticmethod
+    def _compile(value: str):
+        """Pre-split a translation on its {{var}} placeholders.
+
+        Returns the string itself when it has no placeholder, otherwise a
+        tuple alternating literal text and variable names.
+        """
+        if "{{" not in value:
+            return value
+        parts = tuple(PLACEHOLDER_RE.split(value))
+        return parts if len(parts) > 1 else value
+
+    @staticmethod
+    def _interpolate(parts: tuple, kwargs: dict) -> str:
+        """Fill a pre-split translation; unknown placeholders are kept."""
+        pieces = list(parts)
+        for i in range(1, len(pieces), 2):
+            name = pieces[i]
+            pieces[i] = str(kwargs[name]) if name in kwargs else f"{{{{{name}}}}}"
+        return "".join(pieces)
 
     @classmethod
     def t(cls, key: str, lang: str = "en", **kwargs) -> str:  # pylint: disable=invalid-name
@@ -75,12 +121,10 @@ class TranslationService:
         cls._load()
 
         for try_lang in (lang, "en"):
-            lang_data = cls._translations.get(try_lang, {})
-            translation_data = lang_data.get("translation", lang_data)
-            value = cls._get_nested(translation_data, key)
+            value = cls._translations.get(try_lang, {}).get(key)
             if value is not None:
-                for k, v in kwargs.items():
-                    value = value.replace("{{" + k + "}}", str(v))
+                if isinstance(value, tuple):
+                    return cls._interpolate(value, kwargs)
                 return value
 
         return key
@@ -151,3 +195,5 @@ class TranslationService:
     def reset(cls):
         """Reset cached translations (useful for tests)."""
         cls._translations = None
+        for callback in cls._reset_callbacks:
+            callback()
@@ -0,0 +1,25 @@
+"""Celery tasks for the core app."""
+
+import logging
+
+from calendars.celery_app import app
+from core.services.calendar_invitation_service import calendar_invitation_service
+
+logger = logging.getLogger(__name__)
+
+
+@app.task
+def send_invitation_task(sender_email, recipient_email, method, icalendar_data):
+    """Send a calendar invitation email outside of the CalDAV callback request."""
+    if not calendar_invitation_service.send_invitation(
+        sender_email=sender_email,
+        recipient_email=recipient_email,
+        method=method,
+        icalendar_data=icalendar_data,
+    ):
+        logger.error(
+            "Failed to send calendar %s email: %s -> %s",
+            method,
+            sender_email,
+            recipient_email,
+        )
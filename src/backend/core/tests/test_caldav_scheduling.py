@@ -10,12 +10,15 @@ import time
 from datetime import datetime, timedelta
 
 from django.conf import settings
+from django.core import mail
+from django.test import override_settings
 
 import pytest
 
 from caldav.lib.error import NotFoundError
 from core import factories
 from core.services.caldav_service import CalendarService
+from core.services.calendar_invitation_service import CalendarInvitationService
 
 logger = logging.getLogger(__name__)
 
@@ -248,3 +251,51 @@ END:VCALENDAR"""
             # Shutdown server
             server.shutdown()
             server.server_close()
+
+
+@pytest.mark.django_db
+@override_settings(CALDAV_INBOUND_API_KEY="test-inbound-key")
+class TestSchedulingCallbackView:
+    """Tests for the scheduling callback endpoint itself."""
+
+    def _post(self, client):
+        return client.post(
+            "/api/v1.0/caldav-scheduling-callback/",
+            data=(
+                "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nBEGIN:VEVENT\r\n"
+                "UID:callback-test\r\nDTSTART:20260210T140000Z\r\n"
+                "SUMMARY:Callback test\r\n"
+                "ORGANIZER:mailto:alice@example.com\r\n"
+                "ATTENDEE:mailto:bob@example.com\r\n"
+                "END:VEVENT\r\nEND:VCALENDAR\r\n"
+            ),
+            content_type="text/calendar",
+            HTTP_X_API_KEY="test-inbound-key",
+            HTTP_X_CALDAV_SENDER="mailto:alice@example.com",
+            HTTP_X_CALDAV_RECIPIENT="mailto:bob@example.com",
+            HTTP_X_CALDAV_METHOD="REQUEST",
+        )
+
+    @override_settings(CALENDAR_INVITATION_ASYNC=False)
+    def test_callback_sends_email_synchronously(self, client):
+        response = self._post(client)
+        assert response.status_code == 200
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].to == ["bob@example.com"]
+
+    @override_settings(CALENDAR_INVITATION_ASYNC=True)
+    def test_callback_queues_email_when_async(self, client, monkeypatch):
+        sent = []
+        monkeypatch.setattr(
+            CalendarInvitationService,
+            "send_invitation",
+            lambda self, **kwargs: sent.append(kwargs) or True,
+        )
+        response = self._post(client)
+        assert response.status_code == 202
+        # Tasks run eagerly in tests
+        assert len(sent) == 1
+        assert sent[0]["sender_email"] == "mailto:alice@example.com"
+        assert sent[0]["recipient_email"] == "mailto:bob@example.com"
+        assert sent[0]["method"] == "REQUEST"
+        assert "UID:callback-test" in sent[0]["icalendar_data"]
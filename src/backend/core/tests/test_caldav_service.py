@@ -1,11 +1,24 @@
 """Tests for CalDAV service integration."""
 
+import http.server
+import threading
+from datetime import date, datetime
+from datetime import timezone as dt_tz
+from unittest import mock
+
 from django.conf import settings
+from django.core.cache import cache
 
+import icalendar
 import pytest
 
+from caldav.lib.error import NotFoundError
 from core import factories
-from core.services.caldav_service import CalDAVClient, CalendarService
+from core.services.caldav_service import (
+    CalDAVClient,
+    CalDAVHTTPClient,
+    CalendarService,
+)
 
 
 @pytest.mark.django_db
@@ -30,6 +43,32 @@ class TestCalDAVClient:
         assert "X-Forwarded-User" in dav_client.headers
         assert dav_client.headers["X-Forwarded-User"] == user.email
 
+    def test_get_client_shares_http_session(self):
+        """Test that DAVClient instances reuse the same HTTP session."""
+        # pylint: disable=protected-access
+        client = CalDAVClient()
+
+        first = client._get_client(factories.UserFactory())
+        second = client._get_client(factories.UserFactory())
+
+        assert first.session is second.session
+        assert first.headers["X-Forwarded-User"] != second.headers["X-Forwarded-User"]
+
+    def test_get_client_reused_per_user(self):
+        """Test that the DAVClient of a user is built once per CalDAVClient."""
+        # pylint: disable=protected-access
+        user = factories.UserFactory()
+        client = CalDAVClient()
+
+        with mock.patch.object(
+            client._http, "get_dav_client", wraps=client._http.get_dav_client
+        ) as mock_get_dav_client:
+            first = client._get_client(user)
+            second = client._get_client(user)
+
+        assert first is second
+        mock_get_dav_client.assert_called_once_with(user.email)
+
     @pytest.mark.skipif(
         not settings.CALDAV_URL,
         reason="CalDAV server URL not configured",
@@ -83,3 +122,226 @@ class TestCalDAVClient:
         assert info is not None
         assert info["color"] == color
         assert info["name"] == "Red Calendar"
+
+
+class _CookieHandler(http.server.BaseHTTPRequestHandler):
+    """Sets a cookie on every response and records the Cookie headers seen."""
+
+    received_cookies = []
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Record the request cookie and answer with a Set-Cookie."""
+        self.received_cookies.append(self.headers.get("Cookie"))
+        self.send_response(200)
+        self.send_header("Set-Cookie", "PHPSESSID=user-a-session; Path=/")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Keep test output quiet."""
+
+
+class TestCalDAVHTTPClientDavSession:
+    """Tests for the HTTP session shared by DAVClient instances."""
+
+    def test_cookies_are_not_shared_between_users(self, monkeypatch):
+        """A cookie set while acting for one user is not sent for another."""
+        # pylint: disable=protected-access
+        monkeypatch.setattr(CalDAVHTTPClient, "_dav_session", None)
+        _CookieHandler.received_cookies = []
+        server = http.server.HTTPServer(("127.0.0.1", 0), _CookieHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        try:
+            http_client = CalDAVHTTPClient()
+            client_a = http_client.get_dav_client("a@example.com")
+            client_b = http_client.get_dav_client("b@example.com")
+            assert client_b.session is client_a.session
+
+            client_a.session.get(url, headers=client_a.headers)
+            client_b.session.get(url, headers=client_b.headers)
+        finally:
+            server.shutdown()
+            server.server_close()
+            CalDAVHTTPClient._dav_session.close()
+
+        assert _CookieHandler.received_cookies == [None, None]
+
+
+class TestCalDAVClientCalendarHome:
+    """Tests for the cached calendar home discovery."""
+
+    def test_create_calendar_forgets_stale_calendar_home(self):
+        """A failed MKCALENDAR drops the cached calendar home URL."""
+        user = mock.Mock(email="a@example.com")
+        cache.set("caldav:calendar_home:a@example.com", "http://stale/")
+        client = CalDAVClient()
+
+        with (
+            mock.patch.object(client, "_get_client"),
+            mock.patch(
+                "core.services.caldav_service.CalendarSet.make_calendar",
+                side_effect=NotFoundError(),
+            ),
+            pytest.raises(NotFoundError),
+        ):
+            client.create_calendar(user, "Work", "cal-1")
+
+        assert cache.get("caldav:calendar_home:a@example.com") is None
+
+
+class TestCalDAVClientUpdateEvent:
+    """Tests for event updates."""
+
+    @staticmethod
+    def _calendar_with_event():
+        component = icalendar.Event()
+        component.add("uid", "uid-1")
+        component.add("summary", "Standup")
+        component.add("dtstart", datetime(2026, 3, 4, 9, tzinfo=dt_tz.utc))
+        calendar = mock.Mock()
+        calendar.event_by_uid.return_value.icalendar_component = component
+        return calendar, calendar.event_by_uid.return_value
+
+    def test_update_event_saves_changes(self):
+        """Changed fields are written back with a single save."""
+        calendar, event = self._calendar_with_event()
+        client = CalDAVClient()
+
+        with mock.patch.object(client, "_get_calendar", return_value=calendar):
+            client.update_event(
+                mock.Mock(), "/calendars/a/cal/", "uid-1", {"title": "Retro"}
+            )
+
+        assert event.icalendar_component["summary"] == "Retro"
+        event.save.assert_called_once_with()
+
+    def test_update_event_skips_put_when_unchanged(self):
+        """No PUT is sent when the event already has the requested values."""
+        calendar, event = self._calendar_with_event()
+        client = CalDAVClient()
+
+        with mock.patch.object(client, "_get_calendar", return_value=calendar):
+            client.update_event(
+                mock.Mock(),
+                "/calendars/a/cal/",
+                "uid-1",
+                {
+                    "title": "Standup",
+                    "start": datetime(2026, 3, 4, 9, tzinfo=dt_tz.utc),
+                },
+            )
+
+        event.save.assert_not_called()
+
+
+class TestCalDAVClientGetEvents:
+    """Tests for the time-range event search."""
+
+    @staticmethod
+    def _event(uid):
+        event = mock.Mock()
+        event.icalendar_component = {"uid": uid, "summary": f"Event {uid}"}
+        return event
+
+    def test_get_events_expands_recurring_events_by_default(self):
+        """Recurring events are expanded by the server unless told otherwise."""
+        client = CalDAVClient()
+        calendar = mock.Mock()
+        calendar.search.return_value = [self._event("uid-1")]
+
+        with mock.patch.object(client, "_get_calendar", return_value=calendar):
+            events = client.get_events(mock.Mock(), "/calendars/a/cal/")
+
+        assert [event["uid"] for event in events] == ["uid-1"]
+        assert calendar.search.call_args.kwargs["expand"] is True
+
+    def test_parse_event_formats_dates(self):
+        """Date-times and dates are formatted as compact iCalendar values."""
+        # pylint: disable=protected-access
+        event = mock.Mock()
+        event.icalendar_component = icalendar.Event()
+        event.icalendar_component.add("uid", "uid-1")
+        event.icalendar_component.add("dtstart", datetime(2026, 3, 4, 5, 6, 7))
+        event.icalendar_component.add("dtend", date(2026, 3, 5))
+
+        result = CalDAVClient()._parse_event(event)
+
+        assert result["start"] == "20260304T050607Z"
+        assert result["end"] == "20260305"
+
+    def test_get_events_limit_skips_parsing_extra_events(self):
+        """Only the first `limit` events are parsed."""
+        # pylint: disable=protected-access
+        client = CalDAVClient()
+        calendar = mock.Mock()
+        calendar.search.return_value = [self._event(f"uid-{i}") for i in range(5)]
+
+        with (
+            mock.patch.object(client, "_get_calendar", return_value=calendar),
+            mock.patch.object(
+                client, "_parse_event", wraps=client._parse_event
+            ) as mock_parse,
+        ):
+            events = client.get_events(
+                mock.Mock(), "/calendars/a/cal/", expand=False, limit=2
+            )
+
+        assert [event["uid"] for event in events] == ["uid-0", "uid-1"]
+        assert mock_parse.call_count == 2
+        assert calendar.search.call_args.kwargs["expand"] is False
+
+
+class TestCalDAVHTTPClientFindEvent:
+    """Tests for the concurrent event lookup across calendars."""
+
+    @staticmethod
+    def _calendar(event=None):
+        cal = mock.Mock()
+        if event is None:
+            cal.object_by_uid.side_effect = NotFoundError()
+        else:
+            cal.object_by_uid.return_value = event
+        return cal
+
+    def test_find_event_by_uid_returns_first_match(self):
+        """The event is found even when other calendars do not contain it."""
+        event = mock.Mock(data="BEGIN:VCALENDAR")
+        event.url.path = "/calendars/a@example.com/cal-2/event.ics"
+        calendars = [self._calendar(), self._calendar(event), self._calendar()]
+
+        http = CalDAVHTTPClient()
+        with mock.patch.object(http, "get_dav_client") as mock_client:
+            mock_client.return_value.principal.return_value.calendars.return_value = (
+                calendars
+            )
+            result = http.find_event_by_uid("a@example.com", "uid-1")
+
+        assert result == ("BEGIN:VCALENDAR", "/calendars/a@example.com/cal-2/event.ics")
+
+    def test_find_event_by_uid_not_found(self):
+        """(None, None) is returned when no calendar contains the event."""
+        http = CalDAVHTTPClient()
+        with mock.patch.object(http, "get_dav_client") as mock_client:
+            mock_client.return_value.principal.return_value.calendars.return_value = [
+                self._calendar(),
+                self._calendar(),
+            ]
+            assert http.find_event_by_uid("a@example.com", "uid-1") == (None, None)
+
+    def test_find_event_by_uid_skips_failing_calendar(self):
+        """A calendar that errors out does not abort the lookup in the others."""
+        event = mock.Mock(data="BEGIN:VCALENDAR")
+        event.url.path = "/calendars/a@example.com/cal-2/event.ics"
+        failing = mock.Mock()
+        failing.object_by_uid.side_effect = ConnectionError("boom")
+
+        http = CalDAVHTTPClient()
+        with mock.patch.object(http, "get_dav_client") as mock_client:
+            mock_client.return_value.principal.return_value.calendars.return_value = [
+                failing,
+                self._calendar(event),
+            ]
+            result = http.find_event_by_uid("a@example.com", "uid-1")
+
+        assert result == ("BEGIN:VCALENDAR", "/calendars/a@example.com/cal-2/event.ics")
@@ -2,6 +2,11 @@
 
 # pylint: disable=missing-function-docstring,protected-access
 
+from datetime import datetime
+from datetime import timezone as dt_timezone
+from zoneinfo import ZoneInfo
+
+from django.core import mail
 from django.template.loader import render_to_string
 
 import pytest
@@ -67,6 +72,108 @@ class TestICalendarParserUrl:
         assert event.organizer_email == "alice@example.com"
 
 
+class TestICalendarParserProperties:
+    """Tests for property and parameter extraction in ICalendarParser."""
+
+    def test_parse_extracts_attendee_and_organizer(self):
+        event = ICalendarParser.parse(ICS_WITH_URL, "bob@example.com")
+        assert event.organizer_name == "Alice"
+        assert event.attendee_name == "Bob"
+        assert event.attendee_email == "bob@example.com"
+
+    def test_parse_handles_crlf_and_folded_lines(self):
+        ics_data = (
+            "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nBEGIN:VEVENT\r\n"
+            "UID:test-789\r\n"
+            "DTSTART;TZID=Europe/Paris:20260210T140000\r\n"
+            "SUMMARY:A very long\r\n  meeting title\r\n"
+            'ATTENDEE;CN="Bob B.";RSVP=TRUE:MAILTO:bob@example.com\r\n'
+            "END:VEVENT\r\nEND:VCALENDAR\r\n"
+        )
+        event = ICalendarParser.parse(ics_data, "bob@example.com")
+        assert event.summary == "A very long meeting title"
+        assert event.attendee_name == "Bob B."
+        assert str(event.dtstart.tzinfo) == "Europe/Paris"
+
+    def test_parse_strips_mailto_prefix_case_insensitively(self):
+        ics_data = ICS_WITHOUT_URL.replace(
+            "ORGANIZER;CN=Alice:mailto:", "ORGANIZER;CN=Alice:MAILTO:"
+        )
+        event = ICalendarParser.parse(ics_data, "MailTo:Bob@example.com")
+        assert event.organizer_email == "alice@example.com"
+        assert event.attendee_email == "bob@example.com"
+        assert event.attendee_name == "Bob"
+
+    def test_extract_property_is_case_insensitive(self):
+        assert ICalendarParser.extract_property(ICS_WITH_URL, "location") == (
+            "Salle 301"
+        )
+        ics_data = ICS_WITH_URL.replace("DTSTART:", "dtstart;value=DATE-TIME:")
+        value, params = ICalendarParser.extract_property_with_params(
+            ics_data, "DTSTART"
+        )
+        assert value == "20260210T140000Z"
+        assert params == {"VALUE": "DATE-TIME"}
+
+    def test_parse_first_occurrence_wins(self):
+        ics_data = ICS_WITHOUT_URL.replace(
+            "SEQUENCE:0",
+            "BEGIN:VALARM\nDESCRIPTION:Reminder\nEND:VALARM\nSEQUENCE:2",
+        ).replace(
+            "SUMMARY:Simple meeting", "SUMMARY:Simple meeting\nDESCRIPTION:Agenda"
+        )
+        event = ICalendarParser.parse(ics_data, "bob@example.com")
+        assert event.description == "Agenda"
+        assert event.sequence == 2
+
+    def test_parse_ignores_vtimezone_properties(self):
+        ics_data = ICS_WITHOUT_URL.replace(
+            "BEGIN:VEVENT",
+            "BEGIN:VTIMEZONE\nTZID:Europe/Paris\nBEGIN:STANDARD\n"
+            "DTSTART:19701025T030000\nEND:STANDARD\nEND:VTIMEZONE\nBEGIN:VEVENT",
+        )
+        vevent = ICalendarParser.extract_vevent_block(ics_data)
+        assert vevent.startswith("BEGIN:VEVENT\n")
+        assert vevent.endswith("\nEND:VEVENT")
+        assert "VTIMEZONE" not in vevent
+        event = ICalendarParser.parse(ics_data, "bob@example.com")
+        assert event.dtstart.year == 2026
+
+    def test_extract_vevent_block_is_case_insensitive(self):
+        ics_data = ICS_WITHOUT_URL.replace("BEGIN:VEVENT", "Begin:VEvent").replace(
+            "END:VEVENT", "End:VEvent"
+        )
+        vevent = ICalendarParser.extract_vevent_block(ics_data)
+        assert vevent.startswith("Begin:VEvent\n")
+        assert vevent.endswith("\nEnd:VEvent")
+
+
+class TestICalendarParserDatetime:
+    """Tests for date-time value parsing in ICalendarParser."""
+
+    def test_parse_datetime_utc(self):
+        assert ICalendarParser.parse_datetime("20260210T140000Z") == datetime(
+            2026, 2, 10, 14, 0, tzinfo=dt_timezone.utc
+        )
+
+    def test_parse_datetime_with_tzid(self):
+        dt = ICalendarParser.parse_datetime("20260210T140000", "Europe/Paris")
+        assert dt == datetime(2026, 2, 10, 14, 0, tzinfo=ZoneInfo("Europe/Paris"))
+
+    def test_parse_datetime_unknown_tzid_is_naive(self):
+        dt = ICalendarParser.parse_datetime("20260210T140000", "Mars/Olympus")
+        assert dt == datetime(2026, 2, 10, 14, 0)
+
+    def test_parse_datetime_date_only(self):
+        assert ICalendarParser.parse_datetime("20260210") == datetime(2026, 2, 10)
+
+    @pytest.mark.parametrize(
+        "value", ["", "2026-02-10", "20261310", "20260210T1400", "20260210T140000X"]
+    )
+    def test_parse_datetime_invalid(self, value):
+        assert ICalendarParser.parse_datetime(value) is None
+
+
 @pytest.mark.django_db
 class TestEmailTemplateVisioUrl:
     """Tests for visio URL rendering in email templates."""
@@ -100,3 +207,33 @@ class TestEmailTemplateVisioUrl:
         context = self._build_context(event)
         txt = render_to_string("emails/calendar_invitation.txt", context)
         assert "Visio" not in txt
+
+
+@pytest.mark.django_db
+class TestInvitationIcsAttachment:
+    """Tests for the ICS part of invitation emails."""
+
+    def _send(self):
+        service = CalendarInvitationService()
+        sent = service.send_invitation(
+            sender_email="mailto:alice@example.com",
+            recipient_email="mailto:bob@example.com",
+            method="REQUEST",
+            icalendar_data=ICS_WITH_URL,
+        )
+        assert sent is True
+        return mail.outbox[0].attachments[0]
+
+    def test_ics_attachment_is_not_base64(self):
+        attachment = self._send()
+        assert attachment["Content-Transfer-Encoding"] == "8bit"
+        payload = attachment.get_payload(decode=True).decode("utf-8")
+        assert "SUMMARY:Réunion d'équipe" in payload
+
+    def test_ics_attachment_has_a_single_content_type(self, settings):
+        settings.CALENDAR_ITIP_ENABLED = True
+        attachment = self._send()
+        assert len(attachment.get_all("Content-Type")) == 1
+        assert attachment.get_content_type() == "text/calendar"
+        assert attachment.get_param("charset") == "utf-8"
+        assert attachment.get_param("method") == "REQUEST"
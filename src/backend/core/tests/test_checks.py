@@ -0,0 +1,19 @@
+"""Tests for the core system checks."""
+
+from django.test import override_settings
+
+from core.checks import check_caldav_outbound_api_key
+
+
+@override_settings(CALDAV_OUTBOUND_API_KEY="secret")
+def test_checks_caldav_outbound_api_key_configured():
+    """No warning is reported when the outbound API key is set."""
+    assert not check_caldav_outbound_api_key(None)
+
+
+@override_settings(CALDAV_OUTBOUND_API_KEY=None)
+def test_checks_caldav_outbound_api_key_missing():
+    """A warning is reported when the outbound API key is missing."""
+    messages = check_caldav_outbound_api_key(None)
+
+    assert [message.id for message in messages] == ["core.W001"]
@@ -1,18 +1,37 @@
 """Tests for iCal export endpoint."""
 
+import gzip
 import uuid
+from unittest import mock
 
 from django.conf import settings
 from django.urls import reverse
 
 import pytest
 import responses
-from rest_framework.status import HTTP_200_OK, HTTP_404_NOT_FOUND, HTTP_502_BAD_GATEWAY
+from rest_framework.status import (
+    HTTP_200_OK,
+    HTTP_304_NOT_MODIFIED,
+    HTTP_404_NOT_FOUND,
+    HTTP_502_BAD_GATEWAY,
+)
 from rest_framework.test import APIClient
 
 from core import factories
 
 
+def _ctag_body(ctag):
+    """Build a PROPFIND multistatus body carrying the given CTag."""
+    return (
+        '<?xml version="1.0"?>'
+        '<d:multistatus xmlns:d="DAV:" '
+        'xmlns:cs="http://calendarserver.org/ns/">'
+        "<d:response><d:propstat><d:prop>"
+        f"<cs:getctag>{ctag}</cs:getctag>"
+        "</d:prop></d:propstat></d:response></d:multistatus>"
+    )
+
+
 @pytest.mark.django_db
 class TestICalExport:
     """Tests for ICalExportView."""
@@ -136,6 +155,13 @@ END:VCALENDAR"""
             caldav_path = subscription.caldav_path.lstrip("/")
             target_url = f"{caldav_url}/api/v1.0/caldav/{caldav_path}?export"
 
+            rsps.add(
+                "PROPFIND",
+                f"{caldav_url}/api/v1.0/caldav/{caldav_path}",
+                body=_ctag_body("http://sabre.io/ns/sync/1"),
+                status=207,
+                content_type="application/xml",
+            )
             rsps.add(
                 responses.GET,
                 target_url,
@@ -148,10 +174,16 @@ END:VCALENDAR"""
             client.get(url)
 
             # Verify headers sent to CalDAV
-            assert len(rsps.calls) == 1
-            request = rsps.calls[0].request
-            assert request.headers["X-Forwarded-User"] == subscription.owner.email
-            assert request.headers["X-Api-Key"] == settings.CALDAV_OUTBOUND_API_KEY
+            assert [call.request.method for call in rsps.calls] == [
+                "PROPFIND",
+                "GET",
+            ]
+            for call in rsps.calls:
+                request = call.request
+                assert request.headers["X-Forwarded-User"] == subscription.owner.email
+                assert (
+                    request.headers["X-Api-Key"] == settings.CALDAV_OUTBOUND_API_KEY
+                )
 
     def test_export_handles_caldav_error(self):
         """Test that CalDAV server errors are handled gracefully."""
@@ -224,3 +256,478 @@ END:VCALENDAR"""
             response = client.get(url)
 
             assert "My Test Calendar.ics" in response["Content-Disposition"]
+
+    def test_head_returns_ctag_without_export(self):
+        """Test that HEAD answers from a PROPFIND instead of a full export."""
+        subscription = factories.CalendarSubscriptionTokenFactory()
+        client = APIClient()
+
+        with responses.RequestsMock() as rsps:
+            caldav_url = settings.CALDAV_URL
+            caldav_path = subscription.caldav_path.lstrip("/")
+            target_url = f"{caldav_url}/api/v1.0/caldav/{caldav_path}"
+
+            rsps.add(
+                "PROPFIND",
+                target_url,
+                body=_ctag_body("http://sabre.io/ns/sync/42"),
+                status=207,
+                content_type="application/xml",
+            )
+
+            url = reverse("ical-export", kwargs={"token": subscription.token})
+            response = client.head(url)
+
+            assert response.status_code == HTTP_200_OK
+            assert response["ETag"] == '"http://sabre.io/ns/sync/42"'
+            assert response.content == b""
+            assert len(rsps.calls) == 1
+            assert rsps.calls[0].request.headers["Depth"] == "0"
+
+    def test_head_reads_ctag_whatever_the_namespace_prefix(self):
+        """Test that the CTag is found by namespace, not by prefix or quoting."""
+        subscription = factories.CalendarSubscriptionTokenFactory()
+        client = APIClient()
+
+        with responses.RequestsMock() as rsps:
+            caldav_url = settings.CALDAV_URL
+            caldav_path = subscription.caldav_path.lstrip("/")
+
+            rsps.add(
+                "PROPFIND",
+                f"{caldav_url}/api/v1.0/caldav/{caldav_path}",
+                body=(
+                    '<?xml version="1.0" encoding="utf-8"?>'
+                    '<multistatus xmlns="DAV:" '
+                    'xmlns:x1="http://calendarserver.org/ns/">'
+                    "<response><propstat><prop>"
+                    "<x1:getctag><![CDATA[http://sabre.io/ns/sync/42]]></x1:getctag>"
+                    "</prop></propstat></response></multistatus>"
+                ),
+                status=207,
+                content_type="application/xml",
+            )
+
+            url = reverse("ical-export", kwargs={"token": subscription.token})
+            response = client.head(url)
+
+            assert response.status_code == HTTP_200_OK
+            assert response["ETag"] == '"http://sabre.io/ns/sync/42"'
+
+    def test_head_without_parsable_ctag_has_no_etag(self):
+        """Test that a malformed PROPFIND response is answered without ETag."""
+        subscription = factories.CalendarSubscriptionTokenFactory()
+        client = APIClient()
+
+        with responses.RequestsMock() as rsps:
+            caldav_url = settings.CALDAV_URL
+            caldav_path = subscription.caldav_path.lstrip("/")
+
+            rsps.add(
+                "PROPFIND",
+                f"{caldav_url}/api/v1.0/caldav/{caldav_path}",
+                body="<d:multistatus><cs:getctag>42</cs:getctag>",
+                status=207,
+                content_type="application/xml",
+            )
+
+            url = reverse("ical-export", kwargs={"token": subscription.token})
+            response = client.head(url)
+
+            assert response.status_code == HTTP_200_OK
+            assert "ETag" not in response
+
+    def test_head_sets_same_headers_as_export(self):
+        """Test that HEAD carries the Content-Type and filename of the export."""
+        subscription = factories.CalendarSubscriptionTokenFactory(
+            calendar_name="My Test Calendar"
+        )
+        client = APIClient()
+
+        with responses.RequestsMock() as rsps:
+            caldav_url = settings.CALDAV_URL
+            caldav_path = subscription.caldav_path.lstrip("/")
+
+            rsps.add(
+                "PROPFIND",
+                f"{caldav_url}/api/v1.0/caldav/{caldav_path}",
+                body=_ctag_body("http://sabre.io/ns/sync/42"),
+                status=207,
+                content_type="application/xml",
+            )
+
+            url = reverse("ical-export", kwargs={"token": subscription.token})
+            response = client.head(url)
+
+            assert response["Content-Type"] == "text/calendar; charset=utf-8"
+            assert (
+                response["Content-Disposition"]
+                == 'attachment; filename="My Test Calendar.ics"'
+            )
+
+    def test_head_returns_304_when_etag_matches(self):
+        """Test that HEAD answers 304 when If-None-Match matches the CTag."""
+        subscription = factories.CalendarSubscriptionTokenFactory()
+        client = APIClient()
+
+        with responses.RequestsMock() as rsps:
+            caldav_url = settings.CALDAV_URL
+            caldav_path = subscription.caldav_path.lstrip("/")
+
+            rsps.add(
+                "PROPFIND",
+                f"{caldav_url}/api/v1.0/caldav/{caldav_path}",
+                body=_ctag_body("http://sabre.io/ns/sync/42"),
+                status=207,
+                content_type="application/xml",
+            )
+
+            url = reverse("ical-export", kwargs={"token": subscription.token})
+            response = client.head(
+                url, HTTP_IF_NONE_MATCH='"http://sabre.io/ns/sync/42"'
+            )
+
+            assert response.status_code == HTTP_304_NOT_MODIFIED
+            assert response["ETag"] == '"http://sabre.io/ns/sync/42"'
+
+    def test_export_sets_etag_from_ctag(self):
+        """Test that GET exposes the same ETag as HEAD."""
+        subscription = factories.CalendarSubscriptionTokenFactory()
+        client = APIClient()
+
+        with responses.RequestsMock() as rsps:
+            caldav_url = settings.CALDAV_URL
+            caldav_path = subscription.caldav_path.lstrip("/")
+            base_url = f"{caldav_url}/api/v1.0/caldav/{caldav_path}"
+
+            rsps.add(
+                "PROPFIND",
+                base_url,
+                body=_ctag_body("http://sabre.io/ns/sync/42"),
+                status=207,
+                content_type="application/xml",
+            )
+            rsps.add(
+                responses.GET,
+                f"{base_url}?export",
+                body=b"BEGIN:VCALENDAR\nEND:VCALENDAR",
+                status=HTTP_200_OK,
+                content_type="text/calendar",
+            )
+
+            url = reverse("ical-export", kwargs={"token": subscription.token})
+            response = client.get(url)
+
+            assert response.status_code == HTTP_200_OK
+            assert response["ETag"] == '"http://sabre.io/ns/sync/42"'
+            assert "Accept-Encoding" in response["Vary"]
+
+    def test_gzip_export_has_its_own_etag(self):
+        """Test that the gzipped variant is not tagged like the identity one."""
+        subscription = factories.CalendarSubscriptionTokenFactory()
+        client = APIClient()
+        compressed = gzip.compress(b"BEGIN:VCALENDAR\nEND:VCALENDAR")
+
+        with responses.RequestsMock() as rsps:
+            caldav_url = settings.CALDAV_URL
+            caldav_path = subscription.caldav_path.lstrip("/")
+            base_url = f"{caldav_url}/api/v1.0/caldav/{caldav_path}"
+
+            rsps.add(
+                "PROPFIND",
+                base_url,
+                body=_ctag_body("http://sabre.io/ns/sync/42"),
+                status=207,
+                content_type="application/xml",
+            )
+            rsps.add(
+                responses.GET,
+                f"{base_url}?export",
+                body=compressed,
+                status=HTTP_200_OK,
+                content_type="text/calendar",
+                headers={"Content-Encoding": "gzip"},
+            )
+
+            url = reverse("ical-export", kwargs={"token": subscription.token})
+            response = client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+
+            assert response["Content-Encoding"] == "gzip"
+            assert response["ETag"] == 'W/"http://sabre.io/ns/sync/42"'
+            assert "Accept-Encoding" in response["Vary"]
+            assert b"".join(response.streaming_content) == compressed
+
+    def test_head_tags_the_variant_the_client_accepts(self):
+        """Test that HEAD exposes the ETag GET would send for the same client."""
+        subscription = factories.CalendarSubscriptionTokenFactory()
+        client = APIClient()
+
+        with responses.RequestsMock() as rsps:
+            caldav_url = settings.CALDAV_URL
+            caldav_path = subscription.caldav_path.lstrip("/")
+
+            rsps.add(
+                "PROPFIND",
+                f"{caldav_url}/api/v1.0/caldav/{caldav_path}",
+                body=_ctag_body("http://sabre.io/ns/sync/42"),
+                status=207,
+                content_type="application/xml",
+            )
+
+            url = reverse("ical-export", kwargs={"token": subscription.token})
+            response = client.head(url, HTTP_ACCEPT_ENCODING="gzip")
+
+            assert response["ETag"] == 'W/"http://sabre.io/ns/sync/42"'
+            assert "Accept-Encoding" in response["Vary"]
+
+    def test_export_returns_304_when_etag_matches(self):
+        """Test that a matching If-None-Match skips the export entirely."""
+        subscription = factories.CalendarSubscriptionTokenFactory()
+        client = APIClient()
+
+        with responses.RequestsMock() as rsps:
+            caldav_url = settings.CALDAV_URL
+            caldav_path = subscription.caldav_path.lstrip("/")
+
+            rsps.add(
+                "PROPFIND",
+                f"{caldav_url}/api/v1.0/caldav/{caldav_path}",
+                body=_ctag_body("http://sabre.io/ns/sync/42"),
+                status=207,
+                content_type="application/xml",
+            )
+
+            url = reverse("ical-export", kwargs={"token": subscription.token})
+            response = client.get(
+                url, HTTP_IF_NONE_MATCH='W/"http://sabre.io/ns/sync/42"'
+            )
+
+            assert response.status_code == HTTP_304_NOT_MODIFIED
+            assert response["ETag"] == '"http://sabre.io/ns/sync/42"'
+            assert response.content == b""
+            assert len(rsps.calls) == 1
+
+    def test_head_with_invalid_token_returns_404(self):
+        """Test that HEAD with an invalid token returns 404."""
+        client = APIClient()
+
+        url = reverse("ical-export", kwargs={"token": uuid.uuid4()})
+        response = client.head(url)
+
+        assert response.status_code == HTTP_404_NOT_FOUND
+
+    def test_export_forwards_gzip_body_when_accepted(self):
+        """Test that a gzipped upstream export is forwarded without decoding."""
+        subscription = factories.CalendarSubscriptionTokenFactory()
+        client = APIClient()
+        compressed = gzip.compress(b"BEGIN:VCALENDAR\nEND:VCALENDAR")
+
+        with responses.RequestsMock() as rsps:
+            caldav_url = settings.CALDAV_URL
+            caldav_path = subscription.caldav_path.lstrip("/")
+            target_url = f"{caldav_url}/api/v1.0/caldav/{caldav_path}?export"
+
+            rsps.add(
+                responses.GET,
+                target_url,
+                body=compressed,
+                status=HTTP_200_OK,
+                content_type="text/calendar",
+                headers={"Content-Encoding": "gzip"},
+            )
+
+            url = reverse("ical-export", kwargs={"token": subscription.token})
+            response = client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+
+            assert response.status_code == HTTP_200_OK
+            assert response["Content-Encoding"] == "gzip"
+            assert b"".join(response.streaming_content) == compressed
+            assert rsps.calls[-1].request.headers["Accept-Encoding"] == "gzip"
+
+    def test_export_does_not_gzip_when_refused(self):
+        """Test that "gzip;q=0" in Accept-Encoding is treated as a refusal."""
+        subscription = factories.CalendarSubscriptionTokenFactory()
+        client = APIClient()
+
+        with responses.RequestsMock() as rsps:
+            caldav_url = settings.CALDAV_URL
+            caldav_path = subscription.caldav_path.lstrip("/")
+            target_url = f"{caldav_url}/api/v1.0/caldav/{caldav_path}?export"
+
+            rsps.add(
+                responses.GET,
+                target_url,
+                body=b"BEGIN:VCALENDAR\nEND:VCALENDAR",
+                status=HTTP_200_OK,
+                content_type="text/calendar",
+            )
+
+            url = reverse("ical-export", kwargs={"token": subscription.token})
+            response = client.get(url, HTTP_ACCEPT_ENCODING="gzip;q=0, identity")
+
+            assert response.status_code == HTTP_200_OK
+            assert not response.has_header("Content-Encoding")
+            assert response.content == b"BEGIN:VCALENDAR\nEND:VCALENDAR"
+
+    def test_export_served_from_cache_while_ctag_unchanged(self):
+        """Test that an unchanged calendar is exported once, then served from cache."""
+        subscription = factories.CalendarSubscriptionTokenFactory()
+        client = APIClient()
+
+        with responses.RequestsMock() as rsps:
+            caldav_url = settings.CALDAV_URL
+            caldav_path = subscription.caldav_path.lstrip("/")
+            base_url = f"{caldav_url}/api/v1.0/caldav/{caldav_path}"
+
+            propfind = rsps.add(
+                "PROPFIND",
+                base_url,
+                body=_ctag_body("http://sabre.io/ns/sync/7"),
+                status=207,
+                content_type="application/xml",
+            )
+            export = rsps.add(
+                responses.GET,
+                f"{base_url}?export",
+                body=b"BEGIN:VCALENDAR\nEND:VCALENDAR",
+                status=HTTP_200_OK,
+                content_type="text/calendar",
+            )
+
+            url = reverse("ical-export", kwargs={"token": subscription.token})
+            first = client.get(url)
+            second = client.get(url)
+
+            assert first.status_code == second.status_code == HTTP_200_OK
+            assert second.content == first.content == b"BEGIN:VCALENDAR\nEND:VCALENDAR"
+            assert propfind.call_count == 2
+            assert export.call_count == 1
+
+    def test_export_regenerated_when_ctag_changes(self):
+        """Test that a calendar change (new CTag) bypasses the cached export."""
+        subscription = factories.CalendarSubscriptionTokenFactory()
+        client = APIClient()
+
+        with responses.RequestsMock() as rsps:
+            caldav_url = settings.CALDAV_URL
+            caldav_path = subscription.caldav_path.lstrip("/")
+            base_url = f"{caldav_url}/api/v1.0/caldav/{caldav_path}"
+
+            for ctag in ("http://sabre.io/ns/sync/7", "http://sabre.io/ns/sync/8"):
+                rsps.add(
+                    "PROPFIND",
+                    base_url,
+                    body=_ctag_body(ctag),
+                    status=207,
+                    content_type="application/xml",
+                )
+            export = rsps.add(
+                responses.GET,
+                f"{base_url}?export",
+                body=b"BEGIN:VCALENDAR\nEND:VCALENDAR",
+                status=HTTP_200_OK,
+                content_type="text/calendar",
+            )
+
+            url = reverse("ical-export", kwargs={"token": subscription.token})
+            client.get(url)
+            client.get(url)
+
+            assert export.call_count == 2
+
+    def test_export_cache_miss_costs_propfind_then_export(self):
+        """Test that a cache miss asks for the CTag before generating the export."""
+        subscription = factories.CalendarSubscriptionTokenFactory()
+        client = APIClient()
+
+        with responses.RequestsMock() as rsps:
+            caldav_url = settings.CALDAV_URL
+            caldav_path = subscription.caldav_path.lstrip("/")
+            base_url = f"{caldav_url}/api/v1.0/caldav/{caldav_path}"
+
+            rsps.add(
+                "PROPFIND",
+                base_url,
+                body=_ctag_body("http://sabre.io/ns/sync/7"),
+                status=207,
+                content_type="application/xml",
+            )
+            rsps.add(
+                responses.GET,
+                f"{base_url}?export",
+                body=b"BEGIN:VCALENDAR\nEND:VCALENDAR",
+                status=HTTP_200_OK,
+                content_type="text/calendar",
+            )
+
+            url = reverse("ical-export", kwargs={"token": subscription.token})
+            client.get(url)
+
+            assert [call.request.method for call in rsps.calls] == ["PROPFIND", "GET"]
+
+    @mock.patch("core.api.viewsets_ical.EXPORT_CACHE_MAX_SIZE", 8)
+    def test_export_larger_than_cache_limit_is_not_cached(self):
+        """Test that exports over the size limit are regenerated on every poll."""
+        subscription = factories.CalendarSubscriptionTokenFactory()
+        client = APIClient()
+
+        with responses.RequestsMock() as rsps:
+            caldav_url = settings.CALDAV_URL
+            caldav_path = subscription.caldav_path.lstrip("/")
+            base_url = f"{caldav_url}/api/v1.0/caldav/{caldav_path}"
+
+            rsps.add(
+                "PROPFIND",
+                base_url,
+                body=_ctag_body("http://sabre.io/ns/sync/7"),
+                status=207,
+                content_type="application/xml",
+            )
+            export = rsps.add(
+                responses.GET,
+                f"{base_url}?export",
+                body=b"BEGIN:VCALENDAR\nEND:VCALENDAR",
+                status=HTTP_200_OK,
+                content_type="text/calendar",
+            )
+
+            url = reverse("ical-export", kwargs={"token": subscription.token})
+            client.get(url)
+            client.get(url)
+
+            assert export.call_count == 2
+
+    @mock.patch("core.api.viewsets_ical.EXPORT_CACHE_MAX_SIZE", 8)
+    def test_streamed_export_larger_than_cache_limit_is_not_cached(self):
+        """Test that a streamed gzip export over the size limit is not buffered."""
+        subscription = factories.CalendarSubscriptionTokenFactory()
+        client = APIClient()
+        compressed = gzip.compress(b"BEGIN:VCALENDAR\nEND:VCALENDAR")
+
+        with responses.RequestsMock() as rsps:
+            caldav_url = settings.CALDAV_URL
+            caldav_path = subscription.caldav_path.lstrip("/")
+            base_url = f"{caldav_url}/api/v1.0/caldav/{caldav_path}"
+
+            rsps.add(
+                "PROPFIND",
+                base_url,
+                body=_ctag_body("http://sabre.io/ns/sync/7"),
+                status=207,
+                content_type="application/xml",
+            )
+            export = rsps.add(
+                responses.GET,
+                f"{base_url}?export",
+                body=compressed,
+                status=HTTP_200_OK,
+                content_type="text/calendar",
+                headers={"Content-Encoding": "gzip"},
+            )
+
+            url = reverse("ical-export", kwargs={"token": subscription.token})
+            for _ in range(2):
+                response = client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+                assert b"".join(response.streaming_content) == compressed
+
+            assert export.call_count == 2
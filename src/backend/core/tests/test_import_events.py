@@ -14,7 +14,11 @@ import requests as req
 from rest_framework.test import APIClient
 
 from core import factories
-from core.services.caldav_service import CalDAVClient, CalendarService
+from core.services.caldav_service import (
+    CalDAVClient,
+    CalDAVHTTPClient,
+    CalendarService,
+)
 from core.services.import_service import MAX_FILE_SIZE, ICSImportService, ImportResult
 
 pytestmark = pytest.mark.django_db
@@ -273,10 +277,17 @@ def _make_sabredav_response(  # noqa: PLR0913  # pylint: disable=too-many-argume
     return mock_resp
 
 
+@pytest.fixture(name="mock_post")
+def fixture_mock_post():
+    """Mock the request method of the pooled CalDAV HTTP session."""
+    session = MagicMock()
+    with patch.object(CalDAVHTTPClient, "_get_http_session", return_value=session):
+        yield session.request
+
+
 class TestICSImportService:
     """Unit tests for ICSImportService with mocked HTTP call to SabreDAV."""
 
-    @patch("core.services.caldav_service.requests.request")
     def test_import_single_event(self, mock_post):
         """Importing a single event should succeed."""
         mock_post.return_value = _make_sabredav_response(
@@ -299,7 +310,6 @@ class TestICSImportService:
         call_kwargs = mock_post.call_args
         assert call_kwargs.kwargs["data"] == ICS_SINGLE_EVENT
 
-    @patch("core.services.caldav_service.requests.request")
     def test_import_multiple_events(self, mock_post):
         """Importing multiple events should forward all to SabreDAV."""
         mock_post.return_value = _make_sabredav_response(
@@ -319,7 +329,6 @@ class TestICSImportService:
         # Single HTTP call, not one per event
         mock_post.assert_called_once()
 
-    @patch("core.services.caldav_service.requests.request")
     def test_import_empty_ics(self, mock_post):
         """Importing an ICS with no events should return zero counts."""
         mock_post.return_value = _make_sabredav_response(
@@ -337,7 +346,6 @@ class TestICSImportService:
         assert result.skipped_count == 0
         assert not result.errors
 
-    @patch("core.services.caldav_service.requests.request")
     def test_import_invalid_ics(self, mock_post):
         """Importing invalid ICS data should return an error from SabreDAV."""
         mock_post.return_value = _make_sabredav_response(
@@ -354,7 +362,6 @@ class TestICSImportService:
         assert result.imported_count == 0
         assert len(result.errors) >= 1
 
-    @patch("core.services.caldav_service.requests.request")
     def test_import_with_timezone(self, mock_post):
         """Events with timezones should be forwarded to SabreDAV."""
         mock_post.return_value = _make_sabredav_response(
@@ -375,7 +382,6 @@ class TestICSImportService:
         assert b"VTIMEZONE" in call_kwargs.kwargs["data"]
         assert b"Europe/Paris" in call_kwargs.kwargs["data"]
 
-    @patch("core.services.caldav_service.requests.request")
     def test_import_partial_failure(self, mock_post):
         """When some events fail, SabreDAV reports partial success."""
         mock_post.return_value = _make_sabredav_response(
@@ -404,7 +410,6 @@ class TestICSImportService:
         # Only event name is exposed, not raw error details
         assert result.errors[0] == "Afternoon review"
 
-    @patch("core.services.caldav_service.requests.request")
     def test_import_all_day_event(self, mock_post):
         """All-day events should be forwarded to SabreDAV."""
         mock_post.return_value = _make_sabredav_response(
@@ -420,7 +425,6 @@ class TestICSImportService:
         assert result.total_events == 1
         assert result.imported_count == 1
 
-    @patch("core.services.caldav_service.requests.request")
     def test_import_valarm_without_action(self, mock_post):
         """VALARM without ACTION is handled by SabreDAV plugin repair."""
         mock_post.return_value = _make_sabredav_response(
@@ -436,7 +440,6 @@ class TestICSImportService:
         assert result.total_events == 1
         assert result.imported_count == 1
 
-    @patch("core.services.caldav_service.requests.request")
     def test_import_recurring_with_exception(self, mock_post):
         """Recurring event + modified occurrence handled by SabreDAV splitter."""
         mock_post.return_value = _make_sabredav_response(
@@ -453,7 +456,6 @@ class TestICSImportService:
         assert result.total_events == 1
         assert result.imported_count == 1
 
-    @patch("core.services.caldav_service.requests.request")
     def test_import_event_missing_dtstart(self, mock_post):
         """Events without DTSTART handling is delegated to SabreDAV."""
         mock_post.return_value = _make_sabredav_response(
@@ -480,7 +482,6 @@ class TestICSImportService:
         assert result.skipped_count == 1
         assert result.errors[0] == "Missing start"
 
-    @patch("core.services.caldav_service.requests.request")
     def test_import_passes_calendar_path(self, mock_post):
         """The import URL should include the caldav_path."""
         mock_post.return_value = _make_sabredav_response(
@@ -498,7 +499,6 @@ class TestICSImportService:
         assert caldav_path in url
         assert "?import" in url
 
-    @patch("core.services.caldav_service.requests.request")
     def test_import_sends_auth_headers(self, mock_post):
         """The import request must include all required auth headers."""
         mock_post.return_value = _make_sabredav_response(
@@ -518,7 +518,6 @@ class TestICSImportService:
         assert headers["X-Calendars-Import"] == settings.CALDAV_OUTBOUND_API_KEY
         assert headers["Content-Type"] == "text/calendar"
 
-    @patch("core.services.caldav_service.requests.request")
     def test_import_duplicates_not_treated_as_errors(self, mock_post):
         """Duplicate events should be counted separately, not as errors."""
         mock_post.return_value = _make_sabredav_response(
@@ -541,7 +540,25 @@ class TestICSImportService:
         assert result.skipped_count == 0
         assert not result.errors
 
-    @patch("core.services.caldav_service.requests.request")
+    def test_import_streams_uploaded_file(self, mock_post):
+        """Uploaded files should be passed through without being read."""
+        mock_post.return_value = _make_sabredav_response(
+            total_events=1, imported_count=1
+        )
+
+        user = factories.UserFactory()
+        caldav_path = _make_caldav_path(user)
+        ics_file = SimpleUploadedFile(
+            "events.ics", ICS_SINGLE_EVENT, content_type="text/calendar"
+        )
+
+        service = ICSImportService()
+        result = service.import_events(user, caldav_path, ics_file)
+
+        assert result.imported_count == 1
+        assert mock_post.call_args.kwargs["data"] is ics_file
+        assert ics_file.tell() == 0
+
     def test_import_network_failure(self, mock_post):
         """Network failures should return a graceful error."""
         mock_post.side_effect = req.ConnectionError("Connection refused")
@@ -16,12 +16,13 @@ from django.utils import timezone
 import icalendar
 import pytest
 
-from core.api.viewsets_rsvp import RSVPView
-from core.services.caldav_service import CalDAVHTTPClient
+from core.api.viewsets_rsvp import RSVPView, _get_rsvp_strings
+from core.services.caldav_service import PARTSTAT_UNCHANGED, CalDAVHTTPClient
 from core.services.calendar_invitation_service import (
     CalendarInvitationService,
     ICalendarParser,
 )
+from core.services.translation_service import TranslationService
 
 
 def _make_ics(uid="test-uid-123", summary="Team Meeting", sequence=0, days_from_now=30):
@@ -224,6 +225,12 @@ class TestUpdateAttendeePartstat:
         )
         assert result is None
 
+    def test_same_partstat_returns_unchanged(self):
+        result = CalDAVHTTPClient.update_attendee_partstat(
+            SAMPLE_ICS, "bob@example.com", "NEEDS-ACTION"
+        )
+        assert result is PARTSTAT_UNCHANGED
+
     def test_preserves_other_attendee_properties(self):
         result = CalDAVHTTPClient.update_attendee_partstat(
             SAMPLE_ICS, "bob@example.com", "ACCEPTED"
@@ -324,6 +331,21 @@ class TestRSVPView(TestCase):
         put_args = mock_put.call_args
         assert "PARTSTAT=TENTATIVE" in put_args[0][2]
 
+    @patch.object(CalDAVHTTPClient, "put_event")
+    @patch.object(CalDAVHTTPClient, "find_event_by_uid")
+    def test_same_response_twice_skips_put(self, mock_find, mock_put):
+        """Answering with the current PARTSTAT does not PUT the event again."""
+        accepted_ics = SAMPLE_ICS.replace("PARTSTAT=NEEDS-ACTION", "PARTSTAT=ACCEPTED")
+        mock_find.return_value = (accepted_ics, "/path/to/event.ics")
+
+        token = _make_token()
+        request = self.factory.get("/rsvp/", {"token": token, "action": "accepted"})
+        response = self.view(request)
+
+        assert response.status_code == 200
+        assert "accepted the invitation" in response.content.decode()
+        mock_put.assert_not_called()
+
     @patch.object(CalDAVHTTPClient, "find_event_by_uid")
     def test_event_not_found_returns_400(self, mock_find):
         mock_find.return_value = (None, None)
@@ -373,6 +395,13 @@ class TestRSVPView(TestCase):
         assert response.status_code == 400
         assert "already passed" in response.content.decode().lower()
 
+    def test_page_strings_are_memoized_until_translations_reset(self):
+        assert _get_rsvp_strings("en") is _get_rsvp_strings("en")
+
+        TranslationService.reset()
+
+        assert _get_rsvp_strings.cache_info().currsize == 0
+
 
 def _make_ics_with_method(method="REQUEST"):
     """Build a sample ICS string that includes a METHOD property."""
@@ -425,6 +454,42 @@ class TestItipSetting:
         cal = icalendar.Calendar.from_ical(result)
         assert str(cal["METHOD"]) == "REQUEST"
 
+    @override_settings(CALENDAR_ITIP_ENABLED=True)
+    def test_enabled_keeps_matching_method_as_is(self):
+        ics_data = _make_ics_with_method("REQUEST")
+        assert self._prepare(ics_data, method="REQUEST") is ics_data
+
+    @override_settings(CALENDAR_ITIP_ENABLED=True)
+    def test_enabled_adds_method_with_lf_line_endings(self):
+        ics_data = SAMPLE_ICS.replace("\r\n", "\n")
+        result = self._prepare(ics_data, method="CANCEL")
+        assert "VERSION:2.0\nMETHOD:CANCEL\r\n" in result
+
+    @override_settings(CALENDAR_ITIP_ENABLED=False)
+    def test_disabled_strips_method_line_only(self):
+        ics_data = _make_ics_with_method("REQUEST")
+        result = self._prepare(ics_data)
+        assert result == ics_data.replace("METHOD:REQUEST\r\n", "")
+
+    @override_settings(CALENDAR_ITIP_ENABLED=False)
+    def test_disabled_strips_mixed_case_method(self):
+        ics_data = _make_ics_with_method("REQUEST").replace("METHOD:", "Method:")
+        result = self._prepare(ics_data)
+        assert result == ics_data.replace("Method:REQUEST\r\n", "")
+
+    @override_settings(CALENDAR_ITIP_ENABLED=True)
+    def test_enabled_replaces_mixed_case_method(self):
+        ics_data = _make_ics_with_method("CANCEL").replace("METHOD:", "Method:")
+        result = self._prepare(ics_data, method="REQUEST")
+        assert "Method:" not in result
+        assert str(icalendar.Calendar.from_ical(result)["METHOD"]) == "REQUEST"
+
+    @override_settings(CALENDAR_ITIP_ENABLED=True)
+    def test_enabled_adds_method_after_mixed_case_version(self):
+        ics_data = SAMPLE_ICS.replace("VERSION:2.0", "Version:2.0")
+        result = self._prepare(ics_data, method="REQUEST")
+        assert "Version:2.0\r\nMETHOD:REQUEST\r\n" in result
+
 
 @override_settings(
     CALDAV_URL="http://caldav:80",
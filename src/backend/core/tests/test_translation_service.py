@@ -1,7 +1,9 @@
 """Tests for TranslationService."""
 
 from datetime import datetime
+from unittest import mock
 
+from core.services.calendar_invitation_service import _static_strings
 from core.services.translation_service import TranslationService
 
 
@@ -30,10 +32,22 @@ class TestTranslationServiceLookup:  # pylint: disable=missing-function-docstrin
         value = TranslationService.t("nonexistent.key", "fr")
         assert value == "nonexistent.key"
 
+    def test_non_string_key_returns_key(self):
+        """Keys pointing at a group of translations are not translations."""
+        assert TranslationService.t("email.subject", "en") == "email.subject"
+
     def test_interpolation_multiple_vars(self):
         value = TranslationService.t("email.invitation.body", "en", organizer="Alice")
         assert "Alice" in value
 
+    def test_interpolation_keeps_unknown_placeholders(self):
+        # pylint: disable=protected-access
+        parts = TranslationService._compile("{{a}} and {{b}}, {not a var}")
+        assert TranslationService._compile("no placeholder") == "no placeholder"
+        assert TranslationService._interpolate(parts, {"a": 1}) == (
+            "1 and {{b}}, {not a var}"
+        )
+
     def test_rsvp_keys(self):
         assert "accepted" in TranslationService.t("rsvp.accepted", "en").lower()
         assert "accepté" in TranslationService.t("rsvp.accepted", "fr").lower()
@@ -42,6 +56,23 @@ class TestTranslationServiceLookup:  # pylint: disable=missing-function-docstrin
         value = TranslationService.t("rsvp.error.eventPast", "fr")
         assert "passé" in value
 
+    def test_reset_clears_memoized_email_strings(self):
+        # pylint: disable=protected-access
+        _static_strings("en", "invitation")
+        assert _static_strings.cache_info().currsize > 0
+
+        TranslationService.reset()
+
+        assert _static_strings.cache_info().currsize == 0
+
+    def test_reset_runs_registered_callbacks(self):
+        callback = mock.Mock()
+        with mock.patch.object(TranslationService, "_reset_callbacks", []):
+            TranslationService.on_reset(callback)
+            TranslationService.reset()
+
+        callback.assert_called_once_with()
+
 
 class TestNormalizeLang:  # pylint: disable=missing-function-docstring
     """Tests for language normalization."""